@@ -0,0 +1 @@
+"""Núcleo institucional de Tenon. Solo lógica aprobada por RFC."""
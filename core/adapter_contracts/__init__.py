@@ -0,0 +1,17 @@
+"""Frontera contractual core ↔ adapters (RFC-11)."""
+
+from .conformance import ConformanceSuite
+from .declaration import IngestDeclaration
+from .invariants import InvariantValidator, InvariantViolation
+from .loader import ContractLoader
+from .registry import AdapterRegistrationError, AdapterRegistry
+
+__all__ = [
+    "AdapterRegistrationError",
+    "AdapterRegistry",
+    "ConformanceSuite",
+    "ContractLoader",
+    "IngestDeclaration",
+    "InvariantValidator",
+    "InvariantViolation",
+]
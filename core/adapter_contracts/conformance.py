@@ -0,0 +1,271 @@
+"""ConformanceSuite: pruebas canónicas de conformidad de adaptadores (RFC-11 §6).
+
+Los resultados de la suite son artefactos auditables; sin conformidad,
+el adaptador no se despliega ni ingiere.
+"""
+
+import copy
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+
+from .declaration import IngestDeclaration
+from .validation import SchemaValidationFailure, get_validator
+
+# Cada resultado es una tupla (test, result, message): misma información
+# que un dict por entrada pero sin tabla hash por registro; los dicts se
+# materializan solo al serializar.
+TestResult = Tuple[str, str, str]
+
+# Resultados internados: todas las entradas comparten un único objeto str
+# por veredicto en vez de asignar literales repetidos por registro.
+_PASS = sys.intern("PASS")
+_FAIL = sys.intern("FAIL")
+
+
+class ConformanceSuite:
+    """Suite de conformidad para un contrato de adaptador.
+
+    Acepta la función de validación compilada (provista por
+    ``AdapterRegistry``) para no recompilar el esquema en cada corrida;
+    un esquema crudo solo se compila como respaldo cuando no hay
+    validador disponible.
+    """
+
+    def __init__(
+        self,
+        adapter_id: str,
+        adapter_contract: Dict[str, Any],
+        manifest_schema: Optional[Dict[str, Any]] = None,
+        validate_fn: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self.adapter_id = adapter_id
+        self.adapter_contract = adapter_contract
+        if validate_fn is None and manifest_schema is not None:
+            validate_fn = get_validator(manifest_schema)
+        self._validate_fn = validate_fn
+        self.contract_tests_results: List[TestResult] = []
+        self.behavioral_tests_results: List[TestResult] = []
+        self.negative_tests_results: List[TestResult] = []
+
+    # ------------------------------------------------------------------
+    # 6.1 Pruebas de contrato
+    # ------------------------------------------------------------------
+    def run_contract_tests(
+        self, sample_declarations: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Cumplimiento de esquema, versiones declaradas y campos prohibidos."""
+        results = self.contract_tests_results
+        if self._validate_fn is None:
+            results.append(
+                ("schema_compliance", _FAIL, "Sin esquema de contrato disponible")
+            )
+        else:
+            try:
+                self._validate_fn(self.adapter_contract)
+                results.append(
+                    ("schema_compliance", _PASS, "Contrato cumple el esquema")
+                )
+            except SchemaValidationFailure as exc:
+                results.append(("schema_compliance", _FAIL, str(exc)))
+
+        for field in ("schema_version", "adapter_version"):
+            value = self.adapter_contract.get(field, "")
+            parts = str(value).split(".")
+            if len(parts) == 3 and all(p.isdigit() for p in parts):
+                results.append(
+                    (sys.intern(f"version_declared_{field}"), _PASS, f"{field}={value}")
+                )
+            else:
+                results.append(
+                    (sys.intern(f"version_declared_{field}"), _FAIL, f"{field} no es semver: {value!r}")
+                )
+
+        # Camino especializado: isdisjoint corre en C y corta al primer
+        # campo prohibido, sin excepción ni set intermedio por muestra; la
+        # intersección solo se materializa para las muestras en violación.
+        prohibited = IngestDeclaration.PROHIBITED_FIELDS
+        for idx, declaration in enumerate(sample_declarations or []):
+            if prohibited.isdisjoint(declaration):
+                results.append(
+                    (sys.intern(f"prohibited_fields_check_{idx}"), _PASS, "Sin campos prohibidos")
+                )
+            else:
+                results.append(
+                    (
+                        sys.intern(f"prohibited_fields_check_{idx}"),
+                        _FAIL,
+                        "Declaración contiene campos prohibidos por RFC-11: "
+                        f"{sorted(prohibited.intersection(declaration))}",
+                    )
+                )
+
+    # ------------------------------------------------------------------
+    # 6.2 Pruebas de comportamiento
+    # ------------------------------------------------------------------
+    def run_behavioral_tests(
+        self,
+        emit_function: Callable[[Dict[str, Any]], Dict[str, Any]],
+        test_payload: Dict[str, Any],
+    ) -> None:
+        """No mutación del crudo y emisión idéntica bajo reintento.
+
+        La primera emisión sirve tanto para la prueba de inmutabilidad
+        como de primera muestra de idempotencia, así que bastan dos
+        llamadas a ``emit_function`` en vez de tres.
+        """
+        results = self.behavioral_tests_results
+        declaration = {
+            "source_system": self.adapter_id,
+            "payload_raw": test_payload,
+            "payload_format": "JSON",
+            "adapter_version": self.adapter_contract.get("adapter_version", "0.0.0"),
+        }
+
+        original_payload = (
+            copy.deepcopy(test_payload)
+            if isinstance(test_payload, (dict, list))
+            else test_payload
+        )
+        first = emit_function(declaration)
+        if test_payload == original_payload:
+            results.append(
+                ("payload_immutability", _PASS, "El adaptador no mutó el payload crudo")
+            )
+        else:
+            results.append(
+                ("payload_immutability", _FAIL, "El adaptador mutó el payload crudo")
+            )
+
+        second = emit_function(declaration)
+        try:
+            # Comparar digests canónicos es más barato que la igualdad
+            # estructural profunda sobre declaraciones grandes.
+            identical = orjson.dumps(first, option=orjson.OPT_SORT_KEYS) == orjson.dumps(
+                second, option=orjson.OPT_SORT_KEYS
+            )
+        except TypeError:
+            identical = first == second
+        if identical:
+            results.append(
+                ("idempotent_emission", _PASS, "Reintento produce declaración idéntica")
+            )
+        else:
+            results.append(
+                ("idempotent_emission", _FAIL, "Reintento produce declaración distinta")
+            )
+
+    # ------------------------------------------------------------------
+    # 6.3 Pruebas negativas
+    # ------------------------------------------------------------------
+    def run_negative_tests(
+        self, hostile_declarations: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Intentos de escribir campos canónicos deben ser rechazados."""
+        results = self.negative_tests_results
+        if hostile_declarations is None:
+            hostile_declarations = [
+                {"source_system": "X", "event_type": "PAYMENT_SETTLED"},
+                {"source_system": "X", "state": "SETTLED"},
+                {"source_system": "X", "discrepancy": "NONE"},
+                {"source_system": "X", "cause": "ADAPTER_GUESS"},
+            ]
+        for idx, declaration in enumerate(hostile_declarations):
+            try:
+                IngestDeclaration.validate_no_prohibited_fields(declaration)
+                results.append(
+                    (
+                        sys.intern(f"canonical_write_rejected_{idx}"),
+                        _FAIL,
+                        "Declaración hostil no fue rechazada",
+                    )
+                )
+            except ValueError as exc:
+                results.append(
+                    (sys.intern(f"canonical_write_rejected_{idx}"), _PASS, str(exc))
+                )
+
+    # ------------------------------------------------------------------
+    # Reporte auditable
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _as_detail_dicts(results: List[TestResult]) -> List[Dict[str, str]]:
+        return [
+            {"test": test, "result": result, "message": message}
+            for test, result, message in results
+        ]
+
+    def generate_report(self) -> Dict[str, Any]:
+        """Agrega los resultados en un artefacto auditable.
+
+        Un ``Counter`` por lista: una sola pasada en vez de un escaneo
+        completo por cada conteo PASS/FAIL.
+        """
+        contract = Counter(result for _, result, _ in self.contract_tests_results)
+        behavioral = Counter(result for _, result, _ in self.behavioral_tests_results)
+        negative = Counter(result for _, result, _ in self.negative_tests_results)
+        total_failed = contract[_FAIL] + behavioral[_FAIL] + negative[_FAIL]
+        return {
+            "adapter_id": self.adapter_id,
+            "conformant": total_failed == 0,
+            "contract_tests": {
+                "passed": contract[_PASS],
+                "failed": contract[_FAIL],
+                "details": self._as_detail_dicts(self.contract_tests_results),
+            },
+            "behavioral_tests": {
+                "passed": behavioral[_PASS],
+                "failed": behavioral[_FAIL],
+                "details": self._as_detail_dicts(self.behavioral_tests_results),
+            },
+            "negative_tests": {
+                "passed": negative[_PASS],
+                "failed": negative[_FAIL],
+                "details": self._as_detail_dicts(self.negative_tests_results),
+            },
+        }
+
+    def save_report(self, output_path: Path) -> None:
+        """Persiste el reporte como evidencia (append-only: jamás sobrescribe).
+
+        Los arreglos de detalle se escriben entrada por entrada en vez de
+        materializar y serializar el reporte completo en memoria: una
+        suite con miles de declaraciones de muestra produce reportes
+        grandes y el buffer único estresa el allocator.
+        """
+        output_path = Path(output_path)
+        if output_path.exists():
+            raise FileExistsError(
+                f"Reporte ya existe; la evidencia no se sobrescribe: {output_path}"
+            )
+        sections = (
+            (b'"contract_tests"', self.contract_tests_results),
+            (b'"behavioral_tests"', self.behavioral_tests_results),
+            (b'"negative_tests"', self.negative_tests_results),
+        )
+        total_failed = sum(
+            1 for _, results in sections for _, result, _ in results if result == _FAIL
+        )
+        with open(output_path, "wb") as f:
+            f.write(b'{"adapter_id":')
+            f.write(orjson.dumps(self.adapter_id))
+            f.write(b',"conformant":' + (b"true" if total_failed == 0 else b"false"))
+            for name, results in sections:
+                passed = sum(1 for _, result, _ in results if result == _PASS)
+                f.write(
+                    b"," + name + b':{"passed":%d,"failed":%d,"details":['
+                    % (passed, len(results) - passed)
+                )
+                for i, (test, result, message) in enumerate(results):
+                    if i:
+                        f.write(b",")
+                    f.write(
+                        orjson.dumps(
+                            {"test": test, "result": result, "message": message}
+                        )
+                    )
+                f.write(b"]}")
+            f.write(b"}\n")
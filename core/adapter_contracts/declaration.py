@@ -0,0 +1,57 @@
+"""IngestDeclaration: interfaz mínima que un adaptador puede emitir (RFC-11 §4.2).
+
+Un adaptador declara observaciones; jamás declara verdad, estado ni causa.
+"""
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, FrozenSet, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class IngestDeclaration:
+    """Declaración de ingesta emitida por un adaptador.
+
+    Solo transporta el payload crudo y metadatos de origen. Los campos
+    canónicos derivados están prohibidos por contrato. Inmutable y con
+    ``slots``: los adaptadores emiten millones de declaraciones y el
+    ``__dict__`` por instancia es costo puro.
+    """
+
+    PROHIBITED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        {"event_type", "state", "discrepancy", "cause"}
+    )
+
+    source_system: str
+    payload_raw: Any
+    payload_format: str
+    adapter_version: str
+    source_event_id: Optional[str] = None
+    external_reference: Optional[str] = None
+    source_timestamp: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representación serializable de la declaración (sin campos None)."""
+        data = {
+            "source_system": self.source_system,
+            "payload_raw": self.payload_raw,
+            "payload_format": self.payload_format,
+            "adapter_version": self.adapter_version,
+            "source_event_id": self.source_event_id,
+            "external_reference": self.external_reference,
+            "source_timestamp": self.source_timestamp,
+        }
+        return {k: v for k, v in data.items() if v is not None}
+
+    @classmethod
+    def validate_no_prohibited_fields(cls, data: Dict[str, Any]) -> None:
+        """Rechaza declaraciones que intentan escribir campos canónicos.
+
+        Lanza ``ValueError`` con los campos en violación; el rechazo es
+        evidencia, no limpieza silenciosa.
+        """
+        violations = cls.PROHIBITED_FIELDS.intersection(data)
+        if violations:
+            raise ValueError(
+                "Declaración contiene campos prohibidos por RFC-11: "
+                f"{sorted(violations)}"
+            )
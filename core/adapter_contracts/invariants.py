@@ -0,0 +1,130 @@
+"""InvariantValidator: invariantes estructurales del evento canónico (RFC-01 §3).
+
+Valida unicidad de ``event_id`` y trazabilidad mínima obligatoria sobre
+el camino caliente de ingesta; las violaciones se devuelven como
+evidencia, jamás se corrigen en silencio.
+"""
+
+from typing import Any, Dict, List, Optional, Set
+
+
+class InvariantViolation:
+    """Violación de invariante registrada como evidencia."""
+
+    def __init__(self, invariant: str, field: str, message: str) -> None:
+        self.invariant = invariant
+        self.field = field
+        self.message = message
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "invariant": self.invariant,
+            "field": self.field,
+            "message": self.message,
+        }
+
+
+class InvariantValidator:
+    """Validador de invariantes RFC-01 sobre eventos canónicos.
+
+    ``event_store`` es el conjunto autoritativo de ``event_id`` ya
+    aceptados; se usa para la invariante de unicidad (RFC-01A §3.1).
+    ``bloom`` es un filtro probabilístico opcional (p.ej.
+    ``pybloom_live.ScalableBloomFilter``) consultado antes del store: un
+    negativo garantiza unicidad sin tocar el store autoritativo, que a
+    escala de 10⁸+ eventos puede vivir fuera de memoria.
+    """
+
+    TRACEABILITY_FIELDS = frozenset(
+        {
+            "event_id",
+            "source_system",
+            "observed_at",
+            "raw_payload_hash",
+            "raw_pointer",
+            "schema_version",
+        }
+    )
+
+    def __init__(
+        self,
+        event_store: Optional[Set[str]] = None,
+        bloom: Optional[Any] = None,
+    ) -> None:
+        self.event_store = event_store
+        self.bloom = bloom
+
+    def _is_duplicate(self, event_id: str) -> bool:
+        """Prueba de unicidad con pre-chequeo Bloom.
+
+        El filtro solo produce falsos positivos: ``False`` es definitivo
+        y evita la sonda al store; ``True`` exige confirmación
+        autoritativa.
+        """
+        if self.bloom is not None and event_id not in self.bloom:
+            return False
+        return self.event_store is not None and event_id in self.event_store
+
+    def validate(self, event: Dict[str, Any]) -> List[InvariantViolation]:
+        """Devuelve la lista de violaciones; vacía si el evento es válido.
+
+        Unicidad y trazabilidad se resuelven en una sola pasada sobre el
+        evento (una búsqueda por campo, dos operaciones de conjunto), sin
+        frames de helper en el camino caliente; ``_check_uniqueness`` y
+        ``_check_traceability`` quedan como API de diagnóstico puntual.
+        """
+        violations: List[InvariantViolation] = []
+        event_id = event.get("event_id")
+        if event_id and self._is_duplicate(event_id):
+            violations.append(
+                InvariantViolation(
+                    "UNIQUENESS", "event_id", f"event_id ya existe: {event_id}"
+                )
+            )
+        keys = event.keys()
+        missing = self.TRACEABILITY_FIELDS - keys
+        for field in sorted(missing):
+            violations.append(
+                InvariantViolation(
+                    "TRACEABILITY", field, f"campo obligatorio ausente: {field}"
+                )
+            )
+        for field in sorted(self.TRACEABILITY_FIELDS & keys):
+            if not event[field]:
+                violations.append(
+                    InvariantViolation(
+                        "TRACEABILITY", field, f"campo obligatorio vacío: {field}"
+                    )
+                )
+        return violations
+
+    def _check_uniqueness(self, event: Dict[str, Any]) -> List[InvariantViolation]:
+        """``event_id`` jamás se reutiliza (RFC-01A §3.1)."""
+        violations: List[InvariantViolation] = []
+        event_id = event.get("event_id")
+        if event_id and self._is_duplicate(event_id):
+            violations.append(
+                InvariantViolation(
+                    "UNIQUENESS",
+                    "event_id",
+                    f"event_id ya existe: {event_id}",
+                )
+            )
+        return violations
+
+    def _check_traceability(self, event: Dict[str, Any]) -> List[InvariantViolation]:
+        """Trazabilidad mínima obligatoria (RFC-01 §3.4).
+
+        Las dos condiciones (campo ausente, campo vacío) se resuelven con
+        operaciones de conjunto sobre ``event.keys()`` en vez de un loop
+        por campo con búsquedas repetidas.
+        """
+        missing = self.TRACEABILITY_FIELDS - event.keys()
+        empty = [f for f in (self.TRACEABILITY_FIELDS & event.keys()) if not event[f]]
+        return [
+            InvariantViolation("TRACEABILITY", f, f"campo obligatorio ausente: {f}")
+            for f in sorted(missing)
+        ] + [
+            InvariantViolation("TRACEABILITY", f, f"campo obligatorio vacío: {f}")
+            for f in sorted(empty)
+        ]
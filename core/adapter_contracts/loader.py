@@ -0,0 +1,71 @@
+"""ContractLoader: carga de contratos versionados desde /contracts.
+
+Los contratos son ley: cada esquema se lee del disco una sola vez por
+versión y se entrega como vista de solo lectura para impedir mutación
+accidental del contrato en memoria.
+"""
+
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import orjson
+
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
+# Resuelto una sola vez al importar: construir este Path por instancia
+# cuesta asignaciones y stats de filesystem en un camino que la API
+# invita a recorrer por request.
+_DEFAULT_CONTRACTS_ROOT = Path(__file__).resolve().parent.parent.parent / "contracts"
+
+
+class ContractLoader:
+    """Cargador de esquemas de contrato con caché por (tipo, versión)."""
+
+    # kind -> (subdirectorio bajo /contracts/schemas, nombre de archivo)
+    _SCHEMA_SPECS = {
+        "canonical_event": ("canonical_event", "CanonicalEvent.schema.json"),
+        "lineage_link": ("canonical_ids", "LineageLink.schema.json"),
+        "identity_decision": ("canonical_ids", "IdentityDecision.schema.json"),
+    }
+
+    def __init__(self, contracts_root: Optional[Path] = None) -> None:
+        self.contracts_root = (
+            Path(contracts_root) if contracts_root is not None else _DEFAULT_CONTRACTS_ROOT
+        )
+        self._cache: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+
+    @staticmethod
+    def _check_semver(version: str) -> None:
+        """Valida formato MAJOR.MINOR.PATCH (contracts/VERSIONING.md)."""
+        if not _SEMVER_RE.match(version):
+            raise ValueError(f"Invalid version format: {version}")
+
+    def load(self, kind: str, version: str) -> Mapping[str, Any]:
+        """Carga el esquema ``kind`` en la versión dada (con caché)."""
+        try:
+            subdir, filename = self._SCHEMA_SPECS[kind]
+        except KeyError:
+            raise ValueError(f"Unknown schema kind: {kind}") from None
+        self._check_semver(version)
+        key = (kind, version)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        path = self.contracts_root / "schemas" / subdir / version / filename
+        view = MappingProxyType(orjson.loads(path.read_bytes()))
+        self._cache[key] = view
+        return view
+
+    def load_canonical_event_schema(self, version: str) -> Mapping[str, Any]:
+        """Esquema de ``CanonicalEvent`` (RFC-01) para la versión dada."""
+        return self.load("canonical_event", version)
+
+    def load_lineage_link_schema(self, version: str) -> Mapping[str, Any]:
+        """Esquema de ``LineageLink`` (RFC-01A §3.4) para la versión dada."""
+        return self.load("lineage_link", version)
+
+    def load_identity_decision_schema(self, version: str) -> Mapping[str, Any]:
+        """Esquema de ``IdentityDecision`` (RFC-01A §5) para la versión dada."""
+        return self.load("identity_decision", version)
@@ -0,0 +1,107 @@
+"""AdapterRegistry: registro institucional de adaptadores (RFC-11).
+
+El registro es un objeto de larga vida en el camino caliente de ingesta:
+el esquema de contrato se compila una sola vez en ``load_schema`` y el
+validador compilado se reutiliza en cada registro y cada ingesta.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+
+from .declaration import IngestDeclaration
+from .validation import SchemaValidationFailure, get_validator
+
+
+class AdapterRegistrationError(ValueError):
+    """Contrato de adaptador inválido o registro duplicado contradictorio."""
+
+
+class AdapterRegistry:
+    """Registro append-only de contratos de adaptadores.
+
+    Sin contrato válido, la ingesta se rechaza (RFC-11 §3.3).
+    """
+
+    def __init__(self, schema_path: Optional[Path] = None) -> None:
+        self._contracts: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._schema: Optional[Dict[str, Any]] = None
+        self._validate_fn: Optional[Callable[[Any], None]] = None
+        if schema_path is not None:
+            self.load_schema(schema_path)
+
+    def load_schema(self, schema_path: Path) -> None:
+        """Carga el esquema de contrato y compila el validador una sola vez.
+
+        La compilación por llamada de ``jsonschema.validate`` domina la
+        latencia de validación; aquí se paga una única vez por esquema.
+        """
+        with open(schema_path, "r", encoding="utf-8") as f:
+            self._schema = json.load(f)
+        self._validate_fn = get_validator(self._schema)
+
+    def register_adapter(self, adapter_id: str, contract: Dict[str, Any]) -> None:
+        """Registra un contrato de adaptador tras validarlo contra el esquema.
+
+        El registro es append-only: re-registrar un ``adapter_id`` con un
+        contrato distinto es una violación, no una actualización.
+        """
+        if self._validate_fn is None:
+            raise AdapterRegistrationError(
+                "No hay esquema de contrato cargado; registro rechazado"
+            )
+        try:
+            self._validate_fn(contract)
+        except SchemaValidationFailure as exc:
+            raise AdapterRegistrationError(
+                f"Contrato de '{adapter_id}' no cumple el esquema: {exc}"
+            ) from exc
+        with self._lock:
+            existing = self._contracts.get(adapter_id)
+            if existing is not None:
+                if existing != contract:
+                    raise AdapterRegistrationError(
+                        f"Adaptador '{adapter_id}' ya registrado con contrato distinto"
+                    )
+                return
+            self._contracts[adapter_id] = contract
+
+    def register_adapters_bulk(self, items: List[Tuple[str, Path]]) -> None:
+        """Registra N adaptadores leyendo sus contratos en paralelo.
+
+        La lectura + parseo de archivos es I/O-bound y se reparte en un
+        pool de hilos; la validación y el alta usan el camino normal de
+        ``register_adapter`` (validador precompilado, inserción bajo lock),
+        de modo que en arranques fríos con decenas de adaptadores el costo
+        de disco se paga en paralelo sin relajar el contrato.
+        """
+        if not items:
+            return
+
+        def _read(item: Tuple[str, Path]) -> Tuple[str, Dict[str, Any]]:
+            adapter_id, contract_path = item
+            return adapter_id, orjson.loads(Path(contract_path).read_bytes())
+
+        with ThreadPoolExecutor(max_workers=min(len(items), 8)) as pool:
+            contracts = list(pool.map(_read, items))
+        for adapter_id, contract in contracts:
+            self.register_adapter(adapter_id, contract)
+
+    def get_contract(self, adapter_id: str) -> Optional[Dict[str, Any]]:
+        return self._contracts.get(adapter_id)
+
+    def validate_ingest(self, adapter_id: str, declaration: Dict[str, Any]) -> None:
+        """Valida una declaración de ingesta contra la frontera contractual.
+
+        Se llama por evento; todo trabajo por esquema ya está precompilado.
+        """
+        if adapter_id not in self._contracts:
+            raise AdapterRegistrationError(
+                f"Adaptador '{adapter_id}' sin contrato registrado; ingesta rechazada"
+            )
+        IngestDeclaration.validate_no_prohibited_fields(declaration)
@@ -0,0 +1,74 @@
+"""Compilación de validadores de esquema con backend acelerado opcional.
+
+``fastjsonschema`` genera una función Python especializada por esquema
+(sin intérprete que recorra el esquema por llamada). Cuando no está
+instalado se cae a un ``Draft7Validator`` precompilado de ``jsonschema``.
+El backend queda encapsulado: los llamadores solo ven una función
+``validate(instance)`` y la excepción ``SchemaValidationFailure``.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+import jsonschema
+
+# Caché de validadores a nivel de módulo, por identidad del dict de
+# esquema. Los dicts no admiten weakrefs, así que se retiene el esquema
+# junto al validador (el `is` descarta reusos de id) y el tamaño se acota
+# para no crecer sin límite cuando fluyen muchos esquemas.
+_VALIDATOR_CACHE: Dict[int, Tuple[Any, Callable[[Any], None]]] = {}
+_VALIDATOR_CACHE_MAX = 64
+
+
+class SchemaValidationFailure(ValueError):
+    """La instancia no cumple el esquema (independiente del backend)."""
+
+
+def compile_validator(schema: Dict[str, Any]) -> Callable[[Any], None]:
+    """Compila ``schema`` a una función ``validate(instance) -> None``.
+
+    La compilación se paga una sola vez por esquema; la función resultante
+    lanza ``SchemaValidationFailure`` ante instancias inválidas.
+    """
+    if fastjsonschema is not None:
+        compiled = fastjsonschema.compile(schema)
+
+        def _validate(instance: Any) -> None:
+            try:
+                compiled(instance)
+            except fastjsonschema.JsonSchemaException as exc:
+                raise SchemaValidationFailure(str(exc)) from exc
+
+        return _validate
+
+    validator = jsonschema.Draft7Validator(schema)
+
+    def _validate(instance: Any) -> None:
+        try:
+            validator.validate(instance)
+        except jsonschema.ValidationError as exc:
+            raise SchemaValidationFailure(exc.message) from exc
+
+    return _validate
+
+
+def get_validator(schema: Dict[str, Any]) -> Callable[[Any], None]:
+    """Devuelve el validador compilado para ``schema``, memoizado.
+
+    Distintos dueños del mismo dict de esquema (registro por worker,
+    corridas de conformidad, llamadores directos) comparten una única
+    compilación en vez de recompilar por instancia.
+    """
+    key = id(schema)
+    entry = _VALIDATOR_CACHE.get(key)
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    validate = compile_validator(schema)
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_MAX:
+        _VALIDATOR_CACHE.pop(next(iter(_VALIDATOR_CACHE)))
+    _VALIDATOR_CACHE[key] = (schema, validate)
+    return validate
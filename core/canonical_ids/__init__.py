@@ -0,0 +1,36 @@
+"""Identidad, idempotencia y linaje de eventos canónicos (RFC-01A)."""
+
+from .idempotency import IdempotencyKeyGenerator
+from .identity_decider import (
+    ExistingEventIndex,
+    IdentityDecider,
+    IdentityDecision,
+    IdentityDecisionRecord,
+    IdentityMatch,
+    RejectionEvidence,
+    ValidationResult,
+    build_identity_decision_record,
+)
+from .lineage_validator import LineageValidator, LineageViolation
+from .schema_validator import (
+    SchemaValidationResult,
+    SchemaValidator,
+    ValidationError,
+)
+
+__all__ = [
+    "ExistingEventIndex",
+    "IdempotencyKeyGenerator",
+    "IdentityDecider",
+    "IdentityDecision",
+    "IdentityDecisionRecord",
+    "IdentityMatch",
+    "LineageValidator",
+    "LineageViolation",
+    "RejectionEvidence",
+    "ValidationResult",
+    "build_identity_decision_record",
+    "SchemaValidationResult",
+    "SchemaValidator",
+    "ValidationError",
+]
@@ -0,0 +1,30 @@
+# cython: language_level=3
+"""Acelerador opcional de LineageValidator.validate_links.
+
+Se compila con Cython cuando el despliegue lo amerita (millones de links
+por hora); el validador puro-Python es la referencia de semántica y el
+respaldo automático si esta extensión no está construida.
+"""
+
+
+def flag_invalid_links(list links, frozenset valid_types):
+    """Índices de links que fallan alguna comprobación estructural.
+
+    Solo marca; la evidencia de violación la construye el camino Python
+    (frío por diseño: en estado estable casi ningún link falla).
+    """
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t n = len(links)
+    cdef dict link
+    flagged = []
+    for idx in range(n):
+        link = <dict>links[idx]
+        if link.get("type") not in valid_types:
+            flagged.append(idx)
+        elif not link.get("target_event_id"):
+            flagged.append(idx)
+        elif not link.get("evidence"):
+            flagged.append(idx)
+        elif not link.get("version"):
+            flagged.append(idx)
+    return flagged
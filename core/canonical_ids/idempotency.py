@@ -0,0 +1,124 @@
+"""IdempotencyKeyGenerator: derivación determinista de claves (RFC-01A §4.2).
+
+La clave es función determinista de la evidencia mínima disponible del
+evento; misma entrada + misma versión del generador ⇒ misma clave.
+"""
+
+import hashlib
+import operator
+from collections import ChainMap
+from typing import Any, Dict
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+except ImportError:
+    import json
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+class IdempotencyKeyGenerator:
+    """Genera ``idempotency_key`` a partir de los campos de evidencia.
+
+    Cuando existe un identificador fuerte de la fuente
+    (``source_event_id``), ``STRONG_ID_MODE`` hace que la clave se derive
+    solo de él y de ``source_system`` (RFC-01A §4.2: "si source_event_id
+    existe, tiene prioridad"), sin recorrer el resto de la evidencia.
+    Esto cambia el espacio de claves, por eso la versión por defecto es
+    2.0.0: las claves v1 siguen siendo reproducibles instanciando con
+    ``version="1.0.0"`` y ``STRONG_ID_MODE`` desactivado.
+
+    ``hash_algo`` fija el algoritmo (``"sha256"`` por defecto;
+    ``"blake3"`` si el paquete está disponible — SIMD, 3-10x en entradas
+    cortas). El algoritmo forma parte del espacio de claves: cambiarlo
+    exige nueva ``version`` para que claves históricas sigan siendo
+    reproducibles vía el prefijo ``v{version}:``.
+    """
+
+    STRONG_ID_MODE = True
+
+    KEY_FIELDS_PRIORITY = [
+        "source_event_id",
+        "source_system",
+        "external_reference",
+        "event_type",
+        "amount",
+        "currency",
+        "direction",
+        "source_timestamp",
+        "raw_payload_hash",
+        "source_connector",
+        "source_environment",
+        "correlation_id",
+        "counterparty_hint",
+    ]
+
+    # Prefijos "campo:" pre-codificados al definir la clase: evita un
+    # str.encode y una f-string por campo en cada evento.
+    _KEY_FIELDS_BYTES = [
+        (field, field.encode("ascii") + b":") for field in KEY_FIELDS_PRIORITY
+    ]
+
+    # Extracción en bloque: itemgetter construye la tupla de 13 valores en
+    # una sola llamada C; el ChainMap con defaults suple las claves
+    # ausentes sin un event.get por campo en el intérprete.
+    _GETTER = operator.itemgetter(*KEY_FIELDS_PRIORITY)
+    _DEFAULTS = {field: None for field in KEY_FIELDS_PRIORITY}
+
+    def __init__(self, version: str = "2.0.0", hash_algo: str = "sha256") -> None:
+        if hash_algo not in ("sha256", "blake3"):
+            raise ValueError(f"Algoritmo de hash desconocido: {hash_algo}")
+        if hash_algo == "blake3" and blake3 is None:
+            hash_algo = "sha256"
+        self.version = version
+        self.hash_algo = hash_algo
+        # Constructor de hasher y prefijo de versión resueltos una vez:
+        # generate() no repite ni el branch por algoritmo ni la f-string.
+        self._make_hasher = blake3.blake3 if hash_algo == "blake3" else hashlib.sha256
+        self._version_prefix = f"v{version}:"
+
+    def generate(self, event: Dict[str, Any]) -> str:
+        """Deriva la clave de idempotencia del evento.
+
+        Prioridad de evidencia: ``source_event_id`` →
+        ``external_reference`` → hash del conjunto mínimo disponible
+        (RFC-01A §4.2).
+        """
+        if self.STRONG_ID_MODE:
+            source_event_id = event.get("source_event_id")
+            if source_event_id and str(source_event_id).strip():
+                material = (
+                    b"source_event_id:"
+                    + str(source_event_id).encode("utf-8")
+                    + b"|source_system:"
+                    + str(event.get("source_system", "")).encode("utf-8")
+                )
+                return self._version_prefix + self._make_hasher(material).hexdigest()
+        # Acumular en un bytearray contiguo y hashear con un solo update
+        # amortiza mejor que una llamada al hasher por fragmento: el
+        # material completo de un evento cabe en un buffer corto.
+        buf = bytearray()
+        values = self._GETTER(ChainMap(event, self._DEFAULTS))
+        for (field, prefix_bytes), value in zip(self._KEY_FIELDS_BYTES, values):
+            if value is None:
+                continue
+            buf += prefix_bytes
+            if isinstance(value, (dict, list)):
+                # Serialización canónica (claves ordenadas): str(dict)
+                # depende del orden de inserción y rompería el
+                # determinismo de la clave.
+                buf += _dumps(value)
+            else:
+                buf += str(value).encode("utf-8")
+            buf += b"|"
+        return self._version_prefix + self._make_hasher(buf).hexdigest()
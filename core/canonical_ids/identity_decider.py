@@ -0,0 +1,396 @@
+"""IdentityDecider: decisiones explícitas de identidad (RFC-01A §5).
+
+Toda ingesta produce una decisión registrable: ACCEPT,
+REJECT_DUPLICATE o FLAG_AMBIGUOUS. La ambigüedad se preserva; jamás se
+colapsa identidad sin evidencia suficiente.
+"""
+
+import time
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class IdentityDecision(Enum):
+    ACCEPT = "ACCEPT"
+    REJECT_DUPLICATE = "REJECT_DUPLICATE"
+    FLAG_AMBIGUOUS = "FLAG_AMBIGUOUS"
+
+
+# Acceso .value sobre Enum pasa por __getattr__ de la clase; este mapa lo
+# reduce a una búsqueda de dict en los caminos por-evento.
+_DECISION_VALUES = {decision: decision.value for decision in IdentityDecision}
+
+
+class IdentityMatch:
+    """Resultado de una evaluación de identidad."""
+
+    __slots__ = (
+        "decision",
+        "matched_event_id",
+        "match_score",
+        "conflicting_fields",
+        "reason",
+    )
+
+    def __init__(
+        self,
+        decision: IdentityDecision,
+        matched_event_id: Optional[str] = None,
+        match_score: float = 0.0,
+        conflicting_fields: Optional[List[str]] = None,
+        reason: str = "",
+    ) -> None:
+        self.decision = decision
+        self.matched_event_id = matched_event_id
+        self.match_score = match_score
+        self.conflicting_fields = conflicting_fields or []
+        self.reason = reason
+
+
+class RejectionEvidence:
+    """Evidencia adjunta a una decisión de no-aceptación."""
+
+    def __init__(self, reason: str, context: Dict[str, Any]) -> None:
+        self.reason = reason
+        self.context = context
+
+
+class ValidationResult:
+    """Resultado de identidad listo para registrarse append-only."""
+
+    def __init__(
+        self,
+        accepted: bool,
+        event_id: Optional[str] = None,
+        rejection: Optional[RejectionEvidence] = None,
+    ) -> None:
+        self.accepted = accepted
+        self.event_id = event_id
+        self.rejection = rejection
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"accepted": self.accepted, "event_id": self.event_id}
+        if self.rejection is not None:
+            context = self.rejection.context
+            record = context.get("record")
+            if isinstance(record, IdentityDecisionRecord):
+                context = dict(context)
+                context["record"] = record.to_dict()
+            data["rejection"] = {
+                "reason": self.rejection.reason,
+                "context": context,
+            }
+        return data
+
+
+class ExistingEventIndex:
+    """Índice de eventos existentes para decisión de identidad O(1).
+
+    Mantiene dos mapas: ``by_key`` (idempotency_key → evento) y
+    ``by_source_id`` (source_event_id → eventos), de modo que la
+    detección de duplicados exactos y de colisiones de identidad externa
+    sea una búsqueda hash en lugar de un barrido O(N) por evento nuevo.
+
+    ``bloom`` acepta opcionalmente un filtro de Bloom (cualquier objeto
+    con ``add`` y ``__contains__``, p.ej. ``pybloomfilter.BloomFilter``)
+    alimentado con claves y ``source_event_id``: un negativo del filtro
+    garantiza "no visto" y permite aceptar sin tocar los dicts. Los
+    falsos positivos caen a la verificación exacta, nunca al revés.
+    """
+
+    def __init__(self, bloom: Optional[Any] = None) -> None:
+        self.by_key: Dict[str, Dict[str, Any]] = {}
+        self.by_source_id: Dict[str, List[Dict[str, Any]]] = {}
+        self.bloom = bloom
+
+    def add(self, idempotency_key: str, event: Dict[str, Any]) -> None:
+        self.by_key[idempotency_key] = event
+        source_id = event.get("source_event_id")
+        if source_id:
+            self.by_source_id.setdefault(source_id, []).append(event)
+        if self.bloom is not None:
+            self.bloom.add(idempotency_key)
+            if source_id:
+                self.bloom.add(source_id)
+
+    @classmethod
+    def from_dict(cls, existing_events: Dict[str, Dict[str, Any]]) -> "ExistingEventIndex":
+        index = cls()
+        for key, event in existing_events.items():
+            index.add(key, event)
+        return index
+
+
+# Cache (segundo entero → prefijo "YYYY-MM-DDTHH:MM:SS" ya formateado):
+# strftime solo corre cuando cambia el segundo; dentro del mismo segundo
+# solo se formatea el sufijo de microsegundos.
+_LAST_SECOND = 0
+_LAST_PREFIX = ""
+
+
+def _fast_utc_now() -> str:
+    """Timestamp UTC ISO-8601 con sufijo Z, sin pasar por datetime."""
+    global _LAST_SECOND, _LAST_PREFIX
+    now = time.time()
+    second = int(now)
+    if second != _LAST_SECOND:
+        _LAST_PREFIX = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _LAST_SECOND = second
+    return f"{_LAST_PREFIX}.{int((now - second) * 1_000_000):06d}Z"
+
+
+class IdentityDecisionRecord(NamedTuple):
+    """Registro plano de una decisión; el dict anidado se difiere a serialización."""
+
+    decision: str
+    idempotency_key: str
+    matched_event_id: Optional[str]
+    reason: str
+    match_score: float
+    conflicting_fields: List[str]
+    decided_at: str
+    version: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "decision": self.decision,
+            "idempotency_key": self.idempotency_key,
+            "matched_event_id": self.matched_event_id,
+            "evidence": {
+                "reason": self.reason,
+                "match_score": self.match_score,
+                "conflicting_fields": self.conflicting_fields,
+            },
+            "decided_at": self.decided_at,
+            "version": self.version,
+        }
+
+
+def build_identity_decision_record(
+    match: IdentityMatch, idempotency_key: str, version: str = "1.0.0"
+) -> IdentityDecisionRecord:
+    """Registro append-only de la decisión (contrato IdentityDecision).
+
+    Devuelve una tupla nominada plana (una sola asignación, sin dicts
+    intermedios); ``to_dict()`` materializa la forma anidada del contrato
+    solo cuando el registro se serializa.
+    """
+    return IdentityDecisionRecord(
+        decision=_DECISION_VALUES[match.decision],
+        idempotency_key=idempotency_key,
+        matched_event_id=match.matched_event_id,
+        reason=match.reason,
+        match_score=match.match_score,
+        conflicting_fields=match.conflicting_fields,
+        decided_at=_fast_utc_now(),
+        version=version,
+    )
+
+
+# Singleton compartido para el caso dominante (evento genuinamente nuevo):
+# la ruta ACCEPT de un batch no asigna objetos.
+_ACCEPT_MATCH = IdentityMatch(
+    decision=IdentityDecision.ACCEPT,
+    reason="No existing event matches this identity",
+)
+
+# Por debajo de este tamaño el armado de arreglos cuesta más que el loop.
+_VECTOR_THRESHOLD = 64
+
+
+class IdentityDecider:
+    """Aplica el modelo de decisiones de identidad de RFC-01A §5."""
+
+    CRITICAL_FIELDS = [
+        "amount",
+        "currency",
+        "direction",
+        "event_type",
+        "source_system",
+    ]
+
+    def _find_conflicts(
+        self, event1: Dict[str, Any], event2: Dict[str, Any]
+    ) -> List[str]:
+        """Campos críticos en los que dos eventos difieren.
+
+        Desenrollado sobre los 5 campos fijos con los ``get`` ligados una
+        vez: código recto sin costo de iteración por llamada. Si se
+        amplía ``CRITICAL_FIELDS``, ampliar también aquí.
+        """
+        g1 = event1.get
+        g2 = event2.get
+        conflicts = []
+        if g1("amount") != g2("amount"):
+            conflicts.append("amount")
+        if g1("currency") != g2("currency"):
+            conflicts.append("currency")
+        if g1("direction") != g2("direction"):
+            conflicts.append("direction")
+        if g1("event_type") != g2("event_type"):
+            conflicts.append("event_type")
+        if g1("source_system") != g2("source_system"):
+            conflicts.append("source_system")
+        return conflicts
+
+    def _has_conflicts(self, event1: Dict[str, Any], event2: Dict[str, Any]) -> bool:
+        """¿Difiere algún campo crítico? Corta en la primera diferencia."""
+        g1 = event1.get
+        g2 = event2.get
+        return (
+            g1("amount") != g2("amount")
+            or g1("currency") != g2("currency")
+            or g1("direction") != g2("direction")
+            or g1("event_type") != g2("event_type")
+            or g1("source_system") != g2("source_system")
+        )
+
+    def decide(
+        self,
+        event: Dict[str, Any],
+        idempotency_key: str,
+        existing_events: Union[ExistingEventIndex, Dict[str, Dict[str, Any]], None],
+    ) -> IdentityMatch:
+        """Decide ACCEPT / REJECT_DUPLICATE / FLAG_AMBIGUOUS.
+
+        ``existing_events`` debería ser un ``ExistingEventIndex`` en
+        caminos calientes; un dict plano ``key → evento`` se indexa al
+        vuelo (O(N)) por compatibilidad, sin memoizar: el índice no puede
+        saber si el dict mutó entre llamadas y una decisión de identidad
+        sobre un índice rancio sería corrupción silenciosa.
+        """
+        if not existing_events:
+            return _ACCEPT_MATCH
+        if isinstance(existing_events, dict):
+            index = ExistingEventIndex.from_dict(existing_events)
+        else:
+            index = existing_events
+
+        bloom = index.bloom
+        if bloom is not None and idempotency_key not in bloom:
+            source_id = event.get("source_event_id")
+            if not source_id or source_id not in bloom:
+                return _ACCEPT_MATCH
+
+        matched = index.by_key.get(idempotency_key)
+        if matched is not None:
+            # El caso dominante (duplicado exacto) se resuelve con el
+            # booleano que corta en la primera diferencia; la enumeración
+            # completa solo corre para los ambiguos.
+            if self._has_conflicts(event, matched):
+                return IdentityMatch(
+                    decision=IdentityDecision.FLAG_AMBIGUOUS,
+                    matched_event_id=matched.get("event_id"),
+                    match_score=0.5,
+                    conflicting_fields=self._find_conflicts(event, matched),
+                    reason="Same idempotency_key with conflicting critical fields",
+                )
+            return IdentityMatch(
+                decision=IdentityDecision.REJECT_DUPLICATE,
+                matched_event_id=matched.get("event_id"),
+                match_score=1.0,
+                reason="Exact idempotency_key match",
+            )
+
+        source_id = event.get("source_event_id")
+        if source_id:
+            candidates = index.by_source_id.get(source_id, ())
+            if candidates:
+                candidate = candidates[0]
+                return IdentityMatch(
+                    decision=IdentityDecision.FLAG_AMBIGUOUS,
+                    matched_event_id=candidate.get("event_id"),
+                    match_score=0.5,
+                    conflicting_fields=self._find_conflicts(event, candidate),
+                    reason="source_event_id collision with different idempotency_key",
+                )
+
+        return _ACCEPT_MATCH
+
+    def decide_batch(
+        self,
+        events: Sequence[Dict[str, Any]],
+        idempotency_keys: Sequence[str],
+        index: ExistingEventIndex,
+    ) -> List[IdentityMatch]:
+        """Decide un batch completo contra el índice.
+
+        Las filas sin match por clave ni por ``source_event_id`` (el caso
+        común en ingesta ACCEPT-pesada) comparten un ``IdentityMatch``
+        singleton sin construir objetos. Para las filas con match por
+        clave, si NumPy está disponible y el batch lo amerita, los campos
+        críticos se comparan como arreglos columna (una máscara de
+        conflicto por campo) en vez de comparaciones por fila en Python.
+        """
+        if len(events) != len(idempotency_keys):
+            raise ValueError("events e idempotency_keys deben tener igual longitud")
+        results: List[Optional[IdentityMatch]] = [None] * len(events)
+        by_key = index.by_key
+        by_source_id = index.by_source_id
+        keyed_rows: List[int] = []
+        other_rows: List[int] = []
+        for i, (event, key) in enumerate(zip(events, idempotency_keys)):
+            if key in by_key:
+                keyed_rows.append(i)
+            else:
+                source_id = event.get("source_event_id")
+                if source_id and source_id in by_source_id:
+                    other_rows.append(i)
+                else:
+                    results[i] = _ACCEPT_MATCH
+
+        if numpy is not None and len(keyed_rows) >= _VECTOR_THRESHOLD:
+            matched = [by_key[idempotency_keys[i]] for i in keyed_rows]
+            masks = numpy.stack(
+                [
+                    numpy.array([events[i].get(f) for i in keyed_rows], dtype=object)
+                    != numpy.array([m.get(f) for m in matched], dtype=object)
+                    for f in self.CRITICAL_FIELDS
+                ]
+            )
+            any_conflict = masks.any(axis=0)
+            for col, (row, matched_event) in enumerate(zip(keyed_rows, matched)):
+                if any_conflict[col]:
+                    conflicts = [
+                        f
+                        for f, flagged in zip(self.CRITICAL_FIELDS, masks[:, col])
+                        if flagged
+                    ]
+                    results[row] = IdentityMatch(
+                        decision=IdentityDecision.FLAG_AMBIGUOUS,
+                        matched_event_id=matched_event.get("event_id"),
+                        match_score=0.5,
+                        conflicting_fields=conflicts,
+                        reason="Same idempotency_key with conflicting critical fields",
+                    )
+                else:
+                    results[row] = IdentityMatch(
+                        decision=IdentityDecision.REJECT_DUPLICATE,
+                        matched_event_id=matched_event.get("event_id"),
+                        match_score=1.0,
+                        reason="Exact idempotency_key match",
+                    )
+            keyed_rows = []
+
+        for i in keyed_rows + other_rows:
+            results[i] = self.decide(events[i], idempotency_keys[i], index)
+        return results  # type: ignore[return-value]
+
+    def to_validation_result(
+        self, match: IdentityMatch, idempotency_key: str, event_id: Optional[str] = None
+    ) -> ValidationResult:
+        """Convierte la decisión en un resultado registrable."""
+        if match.decision is IdentityDecision.ACCEPT:
+            return ValidationResult(accepted=True, event_id=event_id)
+        record = build_identity_decision_record(match, idempotency_key)
+        context = {"decision": _DECISION_VALUES[match.decision], "record": record}
+        return ValidationResult(
+            accepted=False,
+            event_id=match.matched_event_id,
+            rejection=RejectionEvidence(reason=match.reason, context=context),
+        )
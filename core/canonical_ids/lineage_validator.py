@@ -0,0 +1,258 @@
+"""LineageValidator: validación estructural de linaje (RFC-01A §6).
+
+El linaje es evidencia: cada link declara tipo, evento destino, evidencia
+y versión, y una vez registrado es append-only — los links previos jamás
+se borran ni se mutan.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    # Extensión Cython opcional (_lineage_validator_c.pyx): marca los
+    # links inválidos iterando en C; si no está compilada, el loop
+    # puro-Python cubre la misma semántica.
+    from ._lineage_validator_c import flag_invalid_links as _flag_invalid_links_c
+except ImportError:
+    _flag_invalid_links_c = None
+
+# Por debajo de este tamaño, armar los arreglos cuesta más que el loop.
+_BATCH_VECTOR_THRESHOLD = 64
+
+# Evento vacío compartido para nodos ausentes en all_events: evita un
+# dict nuevo por lookup fallido en el DFS de ciclos.
+_EMPTY_EVENT: Dict[str, Any] = {}
+
+
+class LineageViolation:
+    """Violación de una regla de linaje, con su evidencia."""
+
+    def __init__(
+        self, check: str, message: str, evidence: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.check = check
+        self.message = message
+        self.evidence = evidence or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "check": self.check,
+            "message": self.message,
+            "evidence": self.evidence,
+        }
+
+
+class LineageValidator:
+    """Valida listas de ``LineageLink`` contra las reglas de RFC-01A."""
+
+    VALID_LINEAGE_TYPES = frozenset(
+        {
+            "DERIVES_FROM",
+            "REVERSAL_OF",
+            "REFUND_OF",
+            "ADJUSTMENT_OF",
+            "RELATED_TO",
+        }
+    )
+
+    # Lista precomputada para la evidencia de rechazo: no se reconstruye
+    # (ni re-ordena) en cada violación.
+    _VALID_TYPES_LIST = sorted(VALID_LINEAGE_TYPES)
+
+    def _link_violations(
+        self, idx: int, link: Dict[str, Any], violations: List[LineageViolation]
+    ) -> None:
+        """Acumula las violaciones del link ``idx`` en ``violations``."""
+        link_type = link.get("type")
+        target = link.get("target_event_id")
+        evidence = link.get("evidence")
+        version = link.get("version")
+        if link_type not in self.VALID_LINEAGE_TYPES:
+            violations.append(
+                LineageViolation(
+                    check="valid_type",
+                    message=f"Link {idx} tiene tipo inválido: {link_type!r}",
+                    evidence={
+                        "index": idx,
+                        "type": link_type,
+                        "valid_types": self._VALID_TYPES_LIST,
+                    },
+                )
+            )
+        if not target:
+            violations.append(
+                LineageViolation(
+                    check="target_event_id",
+                    message=f"Link {idx} no declara target_event_id",
+                    evidence={"index": idx},
+                )
+            )
+        if not evidence:
+            violations.append(
+                LineageViolation(
+                    check="evidence",
+                    message=f"Link {idx} no adjunta evidencia",
+                    evidence={"index": idx},
+                )
+            )
+        if not version:
+            violations.append(
+                LineageViolation(
+                    check="version",
+                    message=f"Link {idx} no declara versión",
+                    evidence={"index": idx},
+                )
+            )
+
+    def validate_links(self, links: List[Dict[str, Any]]) -> List[LineageViolation]:
+        """Cada link debe declarar tipo válido, destino, evidencia y versión."""
+        violations: List[LineageViolation] = []
+        if _flag_invalid_links_c is not None:
+            for idx in _flag_invalid_links_c(links, self.VALID_LINEAGE_TYPES):
+                self._link_violations(idx, links[idx], violations)
+            return violations
+        for idx, link in enumerate(links):
+            self._link_violations(idx, link, violations)
+        return violations
+
+    def validate_links_batch(
+        self, links: List[Dict[str, Any]]
+    ) -> List[LineageViolation]:
+        """``validate_links`` para lotes grandes (auditorías de linaje).
+
+        Con NumPy disponible y lote suficiente, los cuatro campos se
+        aplanan a columnas (SoA) y las comprobaciones corren como
+        máscaras vectorizadas en C; solo las filas marcadas vuelven al
+        camino por-link para construir la evidencia de violación. Sin
+        NumPy, o con lotes chicos, delega en el loop escalar.
+        """
+        if numpy is None or len(links) < _BATCH_VECTOR_THRESHOLD:
+            return self.validate_links(links)
+        types = numpy.array([link.get("type") for link in links], dtype=object)
+        targets = numpy.array(
+            [link.get("target_event_id") for link in links], dtype=object
+        )
+        evidences = numpy.array([link.get("evidence") for link in links], dtype=object)
+        versions = numpy.array([link.get("version") for link in links], dtype=object)
+        bad = ~numpy.isin(types, self._VALID_TYPES_LIST)
+        for column in (targets, evidences, versions):
+            bad |= (column == None) | (column == "")  # noqa: E711 — elementwise
+        if not bad.any():
+            return []
+        violations: List[LineageViolation] = []
+        for idx in numpy.flatnonzero(bad):
+            self._link_violations(int(idx), links[idx], violations)
+        return violations
+
+    def validate_append_only(
+        self,
+        previous_links: List[Dict[str, Any]],
+        current_links: List[Dict[str, Any]],
+    ) -> List[LineageViolation]:
+        """El linaje solo crece: ni borrados ni mutaciones de links previos.
+
+        Una sola pasada: los links actuales se indexan por identidad
+        (tipo, target) y cada link previo se resuelve con un lookup —
+        ausente es borrado; presente con ``evidence``/``version``
+        distintos es mutación. Las claves son tuplas nativas (la
+        comparación es solo en proceso, no necesita hash criptográfico).
+        """
+        current_by_identity: Dict[Tuple[str, str], Dict[str, Any]] = {
+            (link.get("type", ""), link.get("target_event_id", "")): link
+            for link in current_links
+        }
+        deleted: List[Tuple[str, str, str, str]] = []
+        mutated: List[Tuple[str, str, str, str]] = []
+        for link in previous_links:
+            identity = (link.get("type", ""), link.get("target_event_id", ""))
+            current = current_by_identity.get(identity)
+            if current is None:
+                deleted.append(identity + (link.get("evidence", ""), link.get("version", "")))
+            elif (
+                current.get("evidence", "") != link.get("evidence", "")
+                or current.get("version", "") != link.get("version", "")
+            ):
+                mutated.append(identity + (link.get("evidence", ""), link.get("version", "")))
+
+        violations: List[LineageViolation] = []
+        if deleted:
+            violations.append(
+                LineageViolation(
+                    check="no_deletion",
+                    message="Links de linaje previos fueron eliminados",
+                    evidence={"deleted_links": sorted(deleted)},
+                )
+            )
+        if mutated:
+            violations.append(
+                LineageViolation(
+                    check="no_mutation",
+                    message="Links de linaje previos fueron mutados",
+                    evidence={"mutated_links": sorted(mutated)},
+                )
+            )
+        return violations
+
+    def validate_no_cycles(
+        self,
+        event_id: str,
+        links: List[Dict[str, Any]],
+        all_events: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> List[LineageViolation]:
+        """Ningún evento puede ser ancestro de sí mismo, directa o transitivamente.
+
+        DFS iterativo con marcado en tres colores: blanco (no visto),
+        gris (en la pila de exploración) y negro (completamente
+        explorado). Un arco hacia un nodo gris cierra un ciclo, que se
+        reporta con su camino reconstruido desde la pila; los nodos
+        negros se saltan por completo, de modo que la detección es
+        O(V+E) incluso sobre grafos de linaje grandes. El auto-link es
+        el ciclo de longitud 1 y cae por el mismo camino.
+
+        No se materializa un mapa de adyacencia: ``all_events`` ya es la
+        adyacencia (los ``lineage_links`` de cada evento), así que cada
+        nodo se expande indexándolo al vuelo — sin una pasada previa por
+        todo el grafo ni copia de sus aristas.
+        """
+        all_events = all_events or {}
+
+        def out_links(node: str) -> Any:
+            if node == event_id:
+                return links
+            return all_events.get(node, _EMPTY_EVENT).get("lineage_links", ())
+
+        WHITE, GRAY, BLACK = 0, 1, 2
+        color: Dict[str, int] = {}
+        # Pila de marcos [nodo, links salientes, índice del próximo
+        # link]: permite retomar la exploración de un nodo en O(1) tras
+        # bajar a un hijo.
+        stack: List[List[Any]] = [[event_id, links, 0]]
+        color[event_id] = GRAY
+        while stack:
+            frame = stack[-1]
+            node, children, i = frame
+            if i >= len(children):
+                color[node] = BLACK
+                stack.pop()
+                continue
+            frame[2] = i + 1
+            child = children[i].get("target_event_id", "")
+            state = color.get(child, WHITE)
+            if state == GRAY:
+                path = [f[0] for f in stack]
+                cycle = path[path.index(child):] + [child]
+                return [
+                    LineageViolation(
+                        check="no_cycles",
+                        message=f"El linaje de {event_id} contiene un ciclo",
+                        evidence={"event_id": event_id, "cycle": cycle},
+                    )
+                ]
+            if state == WHITE:
+                color[child] = GRAY
+                stack.append([child, out_links(child), 0])
+        return []
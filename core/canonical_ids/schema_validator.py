@@ -0,0 +1,265 @@
+"""SchemaValidator: validación de CanonicalEvent contra su contrato (RFC-01).
+
+Los validadores compilados se cachean por ``schema_version``: construir
+un ``Draft7Validator`` (meta-validación del esquema + compilación de
+keywords) y su ``RefResolver`` por evento domina el costo de validación
+en ingesta de alto volumen; aquí se paga una vez por versión.
+"""
+
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import jsonschema
+import orjson
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+from ..adapter_contracts.loader import ContractLoader
+
+DEFAULT_SCHEMA_VERSION = "1.0.0"
+
+# Caches a nivel de módulo, claveados por (raíz de contratos, versión):
+# código de framework que crea un SchemaValidator por request reutiliza
+# los validadores ya compilados en vez de recargar esquemas de disco.
+# Distintas raíces de contratos coexisten sin pisarse.
+_GLOBAL_VALIDATOR_CACHE: Dict[Tuple[str, str], jsonschema.Draft7Validator] = {}
+_GLOBAL_FAST_VALIDATOR_CACHE: Dict[Tuple[str, str], Callable[[Any], Any]] = {}
+_GLOBAL_RS_VALIDATOR_CACHE: Dict[Tuple[str, str], Any] = {}
+
+# Dedup por contenido: versiones distintas con cuerpo de esquema
+# idéntico (bumps de patch, copias por tenant) comparten un único
+# validador compilado; serializar y hashear es mucho más barato que
+# check_schema + compilación.
+_GLOBAL_VALIDATOR_BY_HASH: Dict[str, jsonschema.Draft7Validator] = {}
+
+_hash_bytes = blake3.blake3 if blake3 is not None else hashlib.sha256
+
+
+def _schema_digest(schema: Dict[str, Any]) -> str:
+    """Huella canónica (claves ordenadas) del cuerpo de un esquema."""
+    return _hash_bytes(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+class ValidationError:
+    """Error de validación de esquema sobre un campo del evento."""
+
+    __slots__ = ("field", "message", "value")
+
+    def __init__(self, field: str, message: str, value: Any = None) -> None:
+        self.field = field
+        self.message = message
+        self.value = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"field": self.field, "message": self.message, "value": self.value}
+
+
+class SchemaValidationResult:
+    """Resultado agregado de la validación de un evento."""
+
+    __slots__ = ("valid", "errors")
+
+    def __init__(self, valid: bool, errors: List[ValidationError]) -> None:
+        self.valid = valid
+        self.errors = errors
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+class SchemaValidator:
+    """Valida eventos canónicos con validadores compilados por versión.
+
+    ``backend`` selecciona el motor: ``"jsonschema-rs"`` (nodos de
+    validación nativos en Rust, enumera todos los errores, ~10-50x sobre
+    puro-Python), ``"fastjsonschema"`` (genera código Python
+    especializado por esquema; reporta el primer error) o
+    ``"jsonschema"`` (puro-Python). Las dependencias aceleradas son
+    opcionales: si el backend pedido no está instalado se degrada en ese
+    orden hasta el puro-Python.
+    """
+
+    def __init__(
+        self,
+        contract_loader: Optional[ContractLoader] = None,
+        backend: str = "jsonschema-rs",
+    ) -> None:
+        if backend not in ("jsonschema", "fastjsonschema", "jsonschema-rs"):
+            raise ValueError(f"Backend de validación desconocido: {backend}")
+        if backend == "jsonschema-rs" and jsonschema_rs is None:
+            backend = "fastjsonschema"
+        if backend == "fastjsonschema" and fastjsonschema is None:
+            backend = "jsonschema"
+        self.contract_loader = contract_loader or ContractLoader()
+        self.backend = backend
+        self._cache_root = str(self.contract_loader.contracts_root)
+
+    @classmethod
+    def preload(
+        cls,
+        versions: Sequence[str],
+        contract_loader: Optional[ContractLoader] = None,
+        backend: str = "jsonschema",
+    ) -> "SchemaValidator":
+        """Compila eagerly los validadores de ``versions`` (arranque de app).
+
+        Los caches son de módulo, así que cualquier instancia posterior
+        con la misma raíz de contratos encuentra los validadores ya
+        construidos y el primer evento no paga la compilación.
+        """
+        validator = cls(contract_loader=contract_loader, backend=backend)
+        for version in versions:
+            if validator.backend == "jsonschema-rs":
+                validator._get_rs_validator(version)
+            elif validator.backend == "fastjsonschema":
+                validator._get_fast_validator(version)
+            else:
+                validator._get_validator(version)
+        return validator
+
+    def _get_rs_validator(self, version: str) -> Any:
+        """Validador nativo (jsonschema-rs) compilado para ``version``."""
+        key = (self._cache_root, version)
+        compiled = _GLOBAL_RS_VALIDATOR_CACHE.get(key)
+        if compiled is None:
+            schema = dict(self.contract_loader.load_canonical_event_schema(version))
+            lineage = dict(self.contract_loader.load_lineage_link_schema(version))
+            bundled = self._bundle_lineage(schema, lineage)
+            compiled = jsonschema_rs.validator_for(bundled)
+            _GLOBAL_RS_VALIDATOR_CACHE[key] = compiled
+        return compiled
+
+    @staticmethod
+    def _bundle_lineage(
+        schema: Dict[str, Any], lineage: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Inserta ``LineageLink`` como definición local del esquema.
+
+        Reescribe (DFS con pila, sin recursión) todo ``$ref`` externo a
+        ``#/definitions/LineageLink``, dejando el esquema autocontenido:
+        sin resolución de URIs en tiempo de validación y apto para
+        backends que solo soportan refs locales.
+        """
+        bundled = dict(schema)
+        lineage_def = {k: v for k, v in lineage.items() if k not in ("$schema", "$id")}
+        definitions = dict(bundled.get("definitions", {}))
+        definitions["LineageLink"] = lineage_def
+        bundled["definitions"] = definitions
+
+        def _rewrite(node: Any) -> Any:
+            if isinstance(node, dict):
+                ref = node.get("$ref")
+                if isinstance(ref, str) and not ref.startswith("#"):
+                    node = dict(node)
+                    node["$ref"] = "#/definitions/LineageLink"
+                    return node
+                return {k: _rewrite(v) for k, v in node.items()}
+            if isinstance(node, list):
+                return [_rewrite(item) for item in node]
+            return node
+
+        return _rewrite(bundled)
+
+    def _get_fast_validator(self, version: str) -> Callable[[Any], Any]:
+        """Función de validación generada por fastjsonschema (cacheada)."""
+        key = (self._cache_root, version)
+        compiled = _GLOBAL_FAST_VALIDATOR_CACHE.get(key)
+        if compiled is None:
+            schema = dict(self.contract_loader.load_canonical_event_schema(version))
+            lineage = dict(self.contract_loader.load_lineage_link_schema(version))
+            bundled = self._bundle_lineage(schema, lineage)
+            compiled = fastjsonschema.compile(bundled)
+            _GLOBAL_FAST_VALIDATOR_CACHE[key] = compiled
+        return compiled
+
+    def _get_validator(self, version: str) -> jsonschema.Draft7Validator:
+        """Validador compilado para ``version`` (construido una sola vez).
+
+        En el cache-miss se carga el esquema y su dependencia
+        ``LineageLink``, se inserta la dependencia como definición local
+        (mismo bundle que el backend rápido) y se meta-valida una única
+        vez. El esquema queda autocontenido: la resolución de ``$ref`` es
+        un salto a ``#/definitions`` sin ``RefResolver`` ni URIs de por
+        medio.
+        """
+        key = (self._cache_root, version)
+        validator = _GLOBAL_VALIDATOR_CACHE.get(key)
+        if validator is None:
+            schema = dict(self.contract_loader.load_canonical_event_schema(version))
+            lineage = dict(self.contract_loader.load_lineage_link_schema(version))
+            bundled = self._bundle_lineage(schema, lineage)
+            digest = _schema_digest(bundled)
+            validator = _GLOBAL_VALIDATOR_BY_HASH.get(digest)
+            if validator is None:
+                jsonschema.Draft7Validator.check_schema(bundled)
+                validator = jsonschema.Draft7Validator(bundled)
+                _GLOBAL_VALIDATOR_BY_HASH[digest] = validator
+            _GLOBAL_VALIDATOR_CACHE[key] = validator
+        return validator
+
+    def fast_check(self, event: Dict[str, Any]) -> bool:
+        """¿Pasa el evento el contrato? Solo veredicto, sin errores.
+
+        Para compuertas de producción que solo miran pass/fail: evita
+        construir ``ValidationError`` y formatear rutas/mensajes por
+        error. Los llamadores que hacían ``if validator.validate(event):``
+        deberían migrar aquí; ``validate()`` queda para los caminos que
+        reportan el detalle.
+        """
+        version = event.get("schema_version") or DEFAULT_SCHEMA_VERSION
+        if self.backend == "jsonschema-rs":
+            return self._get_rs_validator(version).is_valid(event)
+        if self.backend == "fastjsonschema":
+            try:
+                self._get_fast_validator(version)(event)
+            except fastjsonschema.JsonSchemaException:
+                return False
+            return True
+        return self._get_validator(version).is_valid(event)
+
+    def validate(self, event: Dict[str, Any]) -> SchemaValidationResult:
+        """Valida un evento contra el contrato de su ``schema_version``."""
+        version = event.get("schema_version") or DEFAULT_SCHEMA_VERSION
+        if self.backend == "jsonschema-rs":
+            errors = [
+                ValidationError(
+                    field="/".join(str(p) for p in error.instance_path) or "$",
+                    message=error.message,
+                )
+                for error in self._get_rs_validator(version).iter_errors(event)
+            ]
+            return SchemaValidationResult(valid=not errors, errors=errors)
+        if self.backend == "fastjsonschema":
+            try:
+                self._get_fast_validator(version)(event)
+            except fastjsonschema.JsonSchemaException as exc:
+                path = getattr(exc, "path", None) or []
+                field = "/".join(str(p) for p in path if p != "data") or "$"
+                return SchemaValidationResult(
+                    valid=False,
+                    errors=[ValidationError(field=field, message=str(exc))],
+                )
+            return SchemaValidationResult(valid=True, errors=[])
+        validator = self._get_validator(version)
+        errors = [
+            ValidationError(
+                field="/".join(str(p) for p in error.absolute_path) or "$",
+                message=error.message,
+                value=error.instance,
+            )
+            for error in validator.iter_errors(event)
+        ]
+        return SchemaValidationResult(valid=not errors, errors=errors)
@@ -0,0 +1,19 @@
+"""Modelo de causalidad explicable (RFC-07)."""
+
+from .v1 import (
+    AppendOnlyCausalityStore,
+    CompactAppendOnlyCausalityStore,
+    CausalityAttribution,
+    CausalityEngine,
+    CausalityRule,
+    CauseType,
+)
+
+__all__ = [
+    "AppendOnlyCausalityStore",
+    "CausalityAttribution",
+    "CausalityEngine",
+    "CausalityRule",
+    "CauseType",
+    "CompactAppendOnlyCausalityStore",
+]
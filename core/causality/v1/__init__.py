@@ -0,0 +1,14 @@
+"""Versión 1 del modelo causal: contratos, motor y registro WORM."""
+
+from .engine import CausalityEngine, CausalityRule
+from .models import CausalityAttribution, CauseType
+from .store import AppendOnlyCausalityStore, CompactAppendOnlyCausalityStore
+
+__all__ = [
+    "AppendOnlyCausalityStore",
+    "CausalityAttribution",
+    "CausalityEngine",
+    "CausalityRule",
+    "CauseType",
+    "CompactAppendOnlyCausalityStore",
+]
@@ -0,0 +1,167 @@
+"""Motor de atribución causal (RFC-07 §6).
+
+Evalúa reglas causales explícitas sobre una discrepancia y su evidencia
+histórica, y emite una o más atribuciones. Las reglas son puras: misma
+evidencia + mismas reglas ⇒ mismas causas (RFC-07 §3.4). Evidencia débil
+no inventa certeza: sin atribuciones, se emite ``UNKNOWN_CAUSE``.
+"""
+
+import operator
+import time
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+
+from .models import CausalityAttribution, CauseType
+
+
+class CausalityRule:
+    """Regla causal explícita y versionada.
+
+    Las implementaciones declaran ``rule_id`` y ``rule_version`` y
+    devuelven cero o más atribuciones desde ``attribute``; una regla que
+    no aplica devuelve la lista vacía, nunca adivina.
+    """
+
+    rule_id: str = ""
+    rule_version: str = ""
+
+    def attribute(
+        self,
+        discrepancy: Dict[str, Any],
+        historical_evidence: Dict[str, Any],
+    ) -> List[CausalityAttribution]:
+        raise NotImplementedError
+
+
+class CausalityEngine:
+    """Aplica un conjunto de reglas causales a discrepancias."""
+
+    UNKNOWN_CONFIDENCE = 0.1
+
+    def __init__(
+        self,
+        rules: Optional[Sequence[CausalityRule]] = None,
+        model_version: str = "1.0.0",
+    ) -> None:
+        self.rules = list(rules or [])
+        self.model_version = model_version
+        # Despacho pre-resuelto: (rule_id, rule_version, método attribute
+        # ligado) por regla. El loop caliente hace una llamada simple sin
+        # releer atributos de la regla en cada discrepancia.
+        self._dispatch = [
+            (rule.rule_id, rule.rule_version, rule.attribute) for rule in self.rules
+        ]
+        # El hook _validate_attribution solo se invoca si una subclase lo
+        # redefine; el stub base no cuesta una llamada por atribución.
+        self._validate_overridden = (
+            type(self)._validate_attribution is not CausalityEngine._validate_attribution
+        )
+
+    def attribute(
+        self,
+        discrepancy: Dict[str, Any],
+        historical_evidence: Optional[Dict[str, Any]] = None,
+        cache: Optional[
+            Dict[Tuple[str, str, str, bytes], List[CausalityAttribution]]
+        ] = None,
+    ) -> List[CausalityAttribution]:
+        """Emite las atribuciones causales de una discrepancia.
+
+        Cada atribución emitida por una regla se sella con el
+        ``attributed_at`` de esta corrida y el ``model_version`` del
+        motor. Como ``CausalityAttribution`` es congelada, el sellado usa
+        ``dataclasses.replace`` (re-ejecuta ``__post_init__``, así que la
+        validación se preserva) en lugar de un round-trip
+        ``to_dict``/``from_dict``.
+
+        ``cache`` memoiza la salida cruda de cada regla por identidad de
+        entrada ``(discrepancy_id, rule_id, rule_version, huella de la
+        evidencia)``. Las reglas son contractualmente puras (RFC-07
+        §3.4), así que el hit es seguro; las atribuciones congeladas se
+        reutilizan sin copiar. La evidencia se huella con una
+        serialización canónica — no con ``id()``, que se recicla.
+        """
+        historical_evidence = historical_evidence or {}
+        attributed_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        model_version = self.model_version
+        discrepancy_id = discrepancy.get("discrepancy_id", "")
+        evidence_digest = b""
+        if cache is not None:
+            try:
+                evidence_digest = orjson.dumps(
+                    historical_evidence, option=orjson.OPT_SORT_KEYS
+                )
+            except TypeError:
+                # Evidencia no serializable: sin huella estable no hay
+                # memoización segura para esta corrida.
+                cache = None
+        all_attributions: List[CausalityAttribution] = []
+        validate_overridden = self._validate_overridden
+        for rule_id, rule_version, rule_attribute in self._dispatch:
+            cache_key = (discrepancy_id, rule_id, rule_version, evidence_digest)
+            if cache is not None and cache_key in cache:
+                emitted = cache[cache_key]
+            else:
+                # El guard cubre solo la llamada externa a la regla; el
+                # sellado y la validación de abajo no quedan bajo el
+                # try/except.
+                try:
+                    emitted = rule_attribute(discrepancy, historical_evidence)
+                except ValueError as exc:
+                    raise ValueError(
+                        f"Regla causal {rule_id}@{rule_version} rechazó la "
+                        f"discrepancia {discrepancy_id!r}: {exc}"
+                    ) from exc
+                if cache is not None:
+                    cache[cache_key] = emitted
+            for attr in emitted:
+                if (
+                    attr.attributed_at != attributed_at
+                    or attr.model_version != model_version
+                ):
+                    attr = replace(
+                        attr, attributed_at=attributed_at, model_version=model_version
+                    )
+                if validate_overridden:
+                    self._validate_attribution(attr, model_version)
+                all_attributions.append(attr)
+
+        if not all_attributions:
+            discrepancy_id = discrepancy.get("discrepancy_id", "")
+            all_attributions.append(
+                CausalityAttribution(
+                    causality_id=f"{discrepancy_id}:UNKNOWN_CAUSE:{model_version}",
+                    discrepancy_id=discrepancy_id,
+                    cause_type=CauseType.UNKNOWN_CAUSE,
+                    confidence_level=self.UNKNOWN_CONFIDENCE,
+                    explanation=(
+                        "Ninguna regla causal aplicó con la evidencia disponible; "
+                        "se registra incertidumbre en lugar de inventar certeza"
+                    ),
+                    attributed_at=attributed_at,
+                    model_version=model_version,
+                )
+            )
+        return self._sort_attributions(all_attributions)
+
+    def _sort_attributions(
+        self, attributions: List[CausalityAttribution]
+    ) -> List[CausalityAttribution]:
+        """Orden determinista: tipo de causa, confianza descendente, id.
+
+        El caso dominante (0-1 atribuciones: regla única o fallback
+        ``UNKNOWN_CAUSE``) no paga el arranque de Timsort. La lista es
+        local al motor, así que se ordena in situ sin copia.
+        """
+        if len(attributions) <= 1:
+            return attributions
+        attributions.sort(key=operator.attrgetter("_sort_key"))
+        return attributions
+
+    def _validate_attribution(
+        self, attribution: CausalityAttribution, model_version: str
+    ) -> None:
+        """Punto de extensión de validación; el contrato ya valida en __post_init__."""
+        pass
@@ -0,0 +1,117 @@
+"""Contratos del modelo causal (RFC-07 §5).
+
+Una atribución causal es inmutable: una vez emitida, su evidencia y su
+explicación no cambian. Múltiples atribuciones pueden coexistir para la
+misma discrepancia sin colapsarse.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Tuple
+
+
+class CauseType(Enum):
+    """Taxonomía cerrada de causas (RFC-07 §4.1)."""
+
+    SOURCE_DELAY = "SOURCE_DELAY"
+    SOURCE_OMISSION = "SOURCE_OMISSION"
+    SOURCE_DUPLICATION = "SOURCE_DUPLICATION"
+    SOURCE_INCONSISTENCY = "SOURCE_INCONSISTENCY"
+    INTEGRATION_MAPPING_ERROR = "INTEGRATION_MAPPING_ERROR"
+    NORMALIZATION_LOSS = "NORMALIZATION_LOSS"
+    CORRELATION_AMBIGUITY = "CORRELATION_AMBIGUITY"
+    STATE_TRANSITION_GAP = "STATE_TRANSITION_GAP"
+    EXTERNAL_SYSTEM_CHANGE = "EXTERNAL_SYSTEM_CHANGE"
+    UNKNOWN_CAUSE = "UNKNOWN_CAUSE"
+
+
+@dataclass(frozen=True, slots=True)
+class CausalityAttribution:
+    """Atribución causal con su evidencia (RFC-07 §5.1).
+
+    Congelada y con slots: el objeto nunca cambia tras construirse, así
+    que la clave de ordenamiento del motor se precomputa una vez en
+    ``__post_init__`` (``_sort_key``) en vez de por comparación, y no se
+    paga el ``__dict__`` por instancia en almacenes WORM grandes.
+    """
+
+    causality_id: str
+    discrepancy_id: str
+    cause_type: CauseType
+    confidence_level: float
+    explanation: str
+    attributed_at: str
+    model_version: str
+    supporting_events: Tuple[str, ...] = ()
+    supporting_states: Tuple[str, ...] = ()
+    supporting_rules: Tuple[str, ...] = ()
+    _sort_key: Tuple[str, float, str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not self.causality_id:
+            raise ValueError("causality_id es obligatorio")
+        if not self.discrepancy_id:
+            raise ValueError("discrepancy_id es obligatorio")
+        if not isinstance(self.cause_type, CauseType):
+            raise ValueError(f"cause_type fuera del enum cerrado: {self.cause_type!r}")
+        if not 0.0 <= self.confidence_level <= 1.0:
+            raise ValueError(
+                f"confidence_level fuera de [0.0, 1.0]: {self.confidence_level!r}"
+            )
+        if not self.explanation:
+            raise ValueError("explanation es obligatoria (RFC-07 §8.1)")
+        # Coerción a tupla: la evidencia de una atribución congelada es
+        # inmutable también en sus colecciones.
+        for name in ("supporting_events", "supporting_states"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+        # Internado de strings que se repiten masivamente entre
+        # atribuciones (ids de discrepancia, versión del modelo, sello de
+        # la corrida, ids de regla): en un almacén WORM longevo colapsan
+        # a un objeto por valor distinto y las comparaciones de claves
+        # del índice se vuelven comparaciones de puntero. No se internan
+        # causality_id (único) ni explanation (larga y única).
+        object.__setattr__(self, "discrepancy_id", sys.intern(self.discrepancy_id))
+        object.__setattr__(self, "model_version", sys.intern(self.model_version))
+        object.__setattr__(self, "attributed_at", sys.intern(self.attributed_at))
+        object.__setattr__(
+            self, "supporting_rules", tuple(map(sys.intern, self.supporting_rules))
+        )
+        object.__setattr__(
+            self,
+            "_sort_key",
+            (self.cause_type.value, -self.confidence_level, self.causality_id),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "causality_id": self.causality_id,
+            "discrepancy_id": self.discrepancy_id,
+            "cause_type": self.cause_type.value,
+            "confidence_level": self.confidence_level,
+            "explanation": self.explanation,
+            "attributed_at": self.attributed_at,
+            "model_version": self.model_version,
+            "supporting_events": self.supporting_events,
+            "supporting_states": self.supporting_states,
+            "supporting_rules": self.supporting_rules,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CausalityAttribution":
+        return cls(
+            causality_id=data["causality_id"],
+            discrepancy_id=data["discrepancy_id"],
+            cause_type=CauseType(data["cause_type"]),
+            confidence_level=data["confidence_level"],
+            explanation=data["explanation"],
+            attributed_at=data["attributed_at"],
+            model_version=data["model_version"],
+            supporting_events=tuple(data.get("supporting_events", ())),
+            supporting_states=tuple(data.get("supporting_states", ())),
+            supporting_rules=tuple(data.get("supporting_rules", ())),
+        )
@@ -0,0 +1,98 @@
+"""Registro append-only de atribuciones causales (RFC-07 §6, RFC-09).
+
+WORM: las atribuciones se escriben una vez y jamás se borran ni se
+reescriben. Nunca se elimina una causa previamente atribuida.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+from .models import CausalityAttribution
+
+
+class AppendOnlyCausalityStore:
+    """Almacén WORM en memoria con índice secundario por discrepancia.
+
+    El índice secundario guarda referencias directas a las atribuciones
+    (no ids a desreferenciar): en un almacén donde nada se borra ni se
+    reescribe, la indirección id → objeto solo añadía un lookup por
+    entrada consultada y duplicaba las claves en memoria.
+    """
+
+    def __init__(self) -> None:
+        self._attributions: Dict[str, CausalityAttribution] = {}
+        self._by_discrepancy: Dict[str, List[CausalityAttribution]] = {}
+
+    def append(self, attribution: CausalityAttribution) -> None:
+        """Registra una atribución; re-escribir una existente se rechaza."""
+        causality_id = attribution.causality_id
+        if causality_id in self._attributions:
+            raise ValueError(
+                f"Atribución ya registrada; el almacén es append-only: {causality_id}"
+            )
+        self._attributions[causality_id] = attribution
+        self._by_discrepancy.setdefault(attribution.discrepancy_id, []).append(
+            attribution
+        )
+
+    def get(self, causality_id: str) -> Optional[CausalityAttribution]:
+        return self._attributions.get(causality_id)
+
+    def list_by_discrepancy(self, discrepancy_id: str) -> List[CausalityAttribution]:
+        """Atribuciones de una discrepancia (copia; el índice no se expone)."""
+        return list(self._by_discrepancy.get(discrepancy_id, ()))
+
+    def iter_all(self) -> Iterator[CausalityAttribution]:
+        return iter(self._attributions.values())
+
+    def __len__(self) -> int:
+        return len(self._attributions)
+
+
+class CompactAppendOnlyCausalityStore:
+    """Variante compacta para auditorías a gran escala.
+
+    Las atribuciones viven en una lista densa en orden de llegada y el
+    índice secundario guarda ``array('I')`` de posiciones: ~4 bytes por
+    entrada en lugar de un puntero de lista Python, y
+    ``list_by_discrepancy`` recorre un arreglo contiguo de enteros en
+    vez de perseguir punteros. Misma semántica WORM que
+    ``AppendOnlyCausalityStore``.
+    """
+
+    def __init__(self) -> None:
+        self._attrs_list: List[CausalityAttribution] = []
+        self._position_by_id: Dict[str, int] = {}
+        self._by_discrepancy: Dict[str, array] = {}
+
+    def append(self, attribution: CausalityAttribution) -> None:
+        """Registra una atribución; re-escribir una existente se rechaza."""
+        causality_id = attribution.causality_id
+        if causality_id in self._position_by_id:
+            raise ValueError(
+                f"Atribución ya registrada; el almacén es append-only: {causality_id}"
+            )
+        position = len(self._attrs_list)
+        self._attrs_list.append(attribution)
+        self._position_by_id[causality_id] = position
+        positions = self._by_discrepancy.get(attribution.discrepancy_id)
+        if positions is None:
+            positions = self._by_discrepancy[attribution.discrepancy_id] = array("I")
+        positions.append(position)
+
+    def get(self, causality_id: str) -> Optional[CausalityAttribution]:
+        position = self._position_by_id.get(causality_id)
+        return None if position is None else self._attrs_list[position]
+
+    def list_by_discrepancy(self, discrepancy_id: str) -> List[CausalityAttribution]:
+        positions = self._by_discrepancy.get(discrepancy_id)
+        if positions is None:
+            return []
+        attrs = self._attrs_list
+        return [attrs[i] for i in positions]
+
+    def iter_all(self) -> Iterator[CausalityAttribution]:
+        return iter(self._attrs_list)
+
+    def __len__(self) -> int:
+        return len(self._attrs_list)
@@ -0,0 +1,15 @@
+"""Control institucional de cambios (RFC-12)."""
+
+from .v1 import (
+    ChangeDeclaration,
+    ChangeEventBuilder,
+    ChangeType,
+    Compatibility,
+)
+
+__all__ = [
+    "ChangeDeclaration",
+    "ChangeEventBuilder",
+    "ChangeType",
+    "Compatibility",
+]
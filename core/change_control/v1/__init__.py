@@ -0,0 +1,10 @@
+"""Versión 1 del control de cambios: declaraciones y evidencia."""
+
+from .models import ChangeDeclaration, ChangeEventBuilder, ChangeType, Compatibility
+
+__all__ = [
+    "ChangeDeclaration",
+    "ChangeEventBuilder",
+    "ChangeType",
+    "Compatibility",
+]
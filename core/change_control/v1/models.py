@@ -0,0 +1,125 @@
+"""Declaraciones de cambio y su evidencia (RFC-12 §5 y §7).
+
+Todo cambio aprobado produce un ``ChangeEvent`` que referencia el RFC,
+las versiones afectadas, la fecha efectiva y los componentes
+impactados; ese evento se escribe en el ledger WORM (RFC-08/RFC-09).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from functools import cached_property
+from typing import Any, Dict, List, Tuple
+
+
+class ChangeType(Enum):
+    """Clasificación cerrada de cambios (RFC-12 §5)."""
+
+    PATCH = "PATCH"
+    MINOR = "MINOR"
+    MAJOR = "MAJOR"
+
+
+class Compatibility(Enum):
+    """Compatibilidad declarada del cambio (RFC-12 §3.3)."""
+
+    BACKWARD_COMPATIBLE = "BACKWARD_COMPATIBLE"
+    FORWARD_COMPATIBLE = "FORWARD_COMPATIBLE"
+    BREAKING = "BREAKING"
+
+
+@dataclass(frozen=True)
+class ChangeDeclaration:
+    """Cambio aprobado, con su RFC, vigencia, alcance y compatibilidad.
+
+    Inmutable una vez construida; las proyecciones derivadas
+    (``isoformat`` de la vigencia, versiones afectadas como dicts) se
+    memoizan con ``cached_property`` porque ``build`` puede re-emitir la
+    misma declaración muchas veces en replays y auditorías. Por eso la
+    clase no usa ``slots``: ``cached_property`` necesita ``__dict__``.
+    """
+
+    rfc_id: str
+    change_type: ChangeType
+    compatibility: Compatibility
+    effective_at: datetime
+    components_impacted: Tuple[str, ...]
+    #: Pares ``(component, version)`` de las versiones que introduce/afecta.
+    versions_affected: Tuple[Tuple[str, str], ...] = field(default=())
+
+    def __post_init__(self) -> None:
+        if not self.rfc_id:
+            raise ValueError("ChangeDeclaration requiere rfc_id (RFC-12 §3.4)")
+        if not isinstance(self.change_type, ChangeType):
+            raise ValueError(f"change_type fuera del enum cerrado: {self.change_type!r}")
+        if not isinstance(self.compatibility, Compatibility):
+            raise ValueError(
+                f"compatibility fuera del enum cerrado: {self.compatibility!r}"
+            )
+        if not isinstance(self.effective_at, datetime):
+            raise ValueError("effective_at debe ser datetime")
+        if not self.components_impacted:
+            raise ValueError(
+                "Un cambio sin componentes impactados no es gobernable (RFC-12 §4)"
+            )
+        if self.change_type is ChangeType.MAJOR and (
+            self.compatibility is not Compatibility.BREAKING
+        ):
+            raise ValueError(
+                "Un Major Change declara BREAKING explícitamente (RFC-12 §5.3)"
+            )
+        object.__setattr__(self, "components_impacted", tuple(self.components_impacted))
+        object.__setattr__(
+            self,
+            "versions_affected",
+            tuple(tuple(pair) for pair in self.versions_affected),
+        )
+
+    @cached_property
+    def effective_at_iso(self) -> str:
+        """``isoformat`` de la vigencia, calculado una sola vez."""
+        return self.effective_at.isoformat()
+
+    @cached_property
+    def versions_affected_dicts(self) -> List[Dict[str, str]]:
+        """Versiones afectadas en la forma que viaja en el ChangeEvent."""
+        return [
+            {"component": component, "version": version}
+            for component, version in self.versions_affected
+        ]
+
+    @cached_property
+    def components_impacted_list(self) -> List[str]:
+        return list(self.components_impacted)
+
+    @cached_property
+    def change_type_value(self) -> str:
+        return self.change_type.value
+
+    @cached_property
+    def compatibility_value(self) -> str:
+        return self.compatibility.value
+
+
+class ChangeEventBuilder:
+    """Construye el ``ChangeEvent`` de evidencia de un cambio aprobado."""
+
+    EVIDENCE_TYPE = "CHANGE_EVENT"
+
+    def build(self, declaration: ChangeDeclaration) -> Dict[str, Any]:
+        """Proyección del cambio lista para el ledger WORM.
+
+        Las piezas derivadas vienen memoizadas de la declaración: en
+        replays repetidos no se re-ejecutan ``isoformat`` ni las
+        comprensiones, y las listas cacheadas se comparten (el ledger
+        serializa, no muta).
+        """
+        return {
+            "evidence_type": self.EVIDENCE_TYPE,
+            "rfc_id": declaration.rfc_id,
+            "change_type": declaration.change_type_value,
+            "compatibility": declaration.compatibility_value,
+            "effective_at": declaration.effective_at_iso,
+            "components_impacted": declaration.components_impacted_list,
+            "versions_affected": declaration.versions_affected_dicts,
+        }
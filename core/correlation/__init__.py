@@ -0,0 +1,29 @@
+"""Motor de correlación: vínculos explicables entre eventos (RFC-04)."""
+
+from .v1 import (
+    CorrelationEngine,
+    CorrelationEvidence,
+    CorrelationLink,
+    CorrelationRule,
+    InMemoryAppendOnlyLinkStore,
+    RuleRegistry,
+    VersionEntry,
+    VersionRegistry,
+    VersionResolver,
+    link_events,
+    score_from_evidence,
+)
+
+__all__ = [
+    "CorrelationEngine",
+    "CorrelationEvidence",
+    "CorrelationLink",
+    "CorrelationRule",
+    "InMemoryAppendOnlyLinkStore",
+    "RuleRegistry",
+    "VersionEntry",
+    "VersionRegistry",
+    "VersionResolver",
+    "link_events",
+    "score_from_evidence",
+]
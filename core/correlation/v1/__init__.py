@@ -0,0 +1,26 @@
+"""Versión 1 del motor de correlación: contratos, reglas, motor y almacén."""
+
+from .engine import CorrelationEngine
+from .rules import CorrelationRule, RuleRegistry
+from .store import InMemoryAppendOnlyLinkStore
+from .types import (
+    CorrelationEvidence,
+    CorrelationLink,
+    link_events,
+    score_from_evidence,
+)
+from .version_registry import VersionEntry, VersionRegistry, VersionResolver
+
+__all__ = [
+    "CorrelationEngine",
+    "CorrelationEvidence",
+    "CorrelationLink",
+    "CorrelationRule",
+    "InMemoryAppendOnlyLinkStore",
+    "RuleRegistry",
+    "VersionEntry",
+    "VersionRegistry",
+    "VersionResolver",
+    "link_events",
+    "score_from_evidence",
+]
@@ -0,0 +1,160 @@
+"""Especialización de reglas por generación de código en tiempo de ejecución.
+
+Cada regla de correlación es estática (tipos de evidencia exigidos,
+constantes de tolerancia y ventana), así que los saltos del camino
+genérico pueden eliminarse por evaluación parcial: se emite una función
+Python por regla que contiene solo los chequeos que esa regla necesita,
+con las constantes ya plegadas, y se compila una única vez. La función
+generada replica exactamente la semántica del camino genérico
+(evidencia en orden canónico, score medio con ajuste por coincidencia
+exacta, descarte bajo el score mínimo).
+"""
+
+from typing import Callable, FrozenSet, List
+
+from .types import CorrelationEvidence, EvidenceType
+
+#: Contribuciones al score plegadas en el código generado; deben coincidir
+#: con ``types._SCORE_TABLE`` más el ajuste por ``exact_match``.
+_REF_CONTRIBUTION = 0.5
+_AMOUNT_CONTRIBUTION = 0.3
+_AMOUNT_EXACT_CONTRIBUTION = 0.4
+_TIME_CONTRIBUTION = 0.2
+
+
+def _reference_block(required: bool) -> List[str]:
+    make = (
+        '        _v = CorrelationEvidence(_REF, "Referencia externa compartida: "'
+        ' + str(_r), {"exact_match": True})'
+    )
+    if required:
+        return [
+            "    _r = refs[i]",
+            "    if not _r or _r != refs[j]:",
+            "        return None",
+            make.replace("        _v =", "    ref_ev ="),
+            f"    total += {_REF_CONTRIBUTION!r}",
+        ]
+    return [
+        "    ref_ev = None",
+        "    _r = refs[i]",
+        "    if _r and _r == refs[j]:",
+        make.replace("_v =", "ref_ev ="),
+        f"        total += {_REF_CONTRIBUTION!r}",
+    ]
+
+
+def _amount_block(required: bool, tolerance: float) -> List[str]:
+    make = [
+        "_exact = _a1 == _a2",
+        'amt_ev = CorrelationEvidence(_AMT, "Montos dentro de tolerancia: "'
+        ' + str(raw_amounts[i]) + " ~ " + str(raw_amounts[j]),'
+        f' {{"tolerance_percentage": {tolerance * 100!r}, "exact_match": _exact}})',
+        f"total += {_AMOUNT_EXACT_CONTRIBUTION!r} if _exact else {_AMOUNT_CONTRIBUTION!r}",
+    ]
+    head = [
+        "    _a1 = amounts[i]",
+        "    _a2 = amounts[j]",
+    ]
+    if required:
+        return head + [
+            f"    if not (_a1 and _a2 and abs(_a1 - _a2) / _a1 <= {tolerance!r}):",
+            "        return None",
+        ] + ["    " + line for line in make]
+    return head + [
+        "    amt_ev = None",
+        f"    if _a1 and _a2 and abs(_a1 - _a2) / _a1 <= {tolerance!r}:",
+    ] + ["        " + line for line in make]
+
+
+def _time_block(required: bool, window_minutes: float) -> List[str]:
+    # La descripción se arma con formateo clásico para no anidar f-strings
+    # en el código emitido; NaN se detecta con ``x != x``.
+    head = [
+        "    _m1 = ts_minutes[i]",
+        "    _m2 = ts_minutes[j]",
+    ]
+    if required:
+        return head + [
+            "    if _m1 != _m1 or _m2 != _m2:",  # NaN: timestamp no parseado
+            "        return None",
+            "    _delta = _m1 - _m2 if _m1 >= _m2 else _m2 - _m1",
+            f"    if _delta > {window_minutes!r}:",
+            "        return None",
+            '    time_ev = CorrelationEvidence(_TIME, "Eventos dentro de ventana'
+            ' temporal de %.1f minutos" % _delta, {"window_minutes": _delta})',
+            f"    total += {_TIME_CONTRIBUTION!r}",
+        ]
+    return head + [
+        "    time_ev = None",
+        "    if _m1 == _m1 and _m2 == _m2:",
+        "        _delta = _m1 - _m2 if _m1 >= _m2 else _m2 - _m1",
+        f"        if _delta <= {window_minutes!r}:",
+        '            time_ev = CorrelationEvidence(_TIME, "Eventos dentro de'
+        ' ventana temporal de %.1f minutos" % _delta, {"window_minutes": _delta})',
+        f"            total += {_TIME_CONTRIBUTION!r}",
+    ]
+
+
+def build_rule_scorer(
+    rule,
+    amount_tolerance: float,
+    time_window_minutes: float,
+    min_score: float,
+) -> Callable:
+    """Compila el evaluador especializado ``(refs, amounts, raw_amounts,
+    ts_minutes, i, j) -> Optional[(evidencia, score)]`` de una regla.
+
+    Los tipos exigidos se chequean primero (con ``return None``
+    temprano); los demás solo aportan score. El orden canónico de la
+    evidencia se restaura al construir la lista final.
+    """
+    required: FrozenSet[EvidenceType] = frozenset(
+        EvidenceType.coerce(name) for name in rule.evidence_required
+    )
+    blocks = {
+        EvidenceType.REFERENCE_MATCH: lambda req: _reference_block(req),
+        EvidenceType.AMOUNT_TOLERANCE: lambda req: _amount_block(req, amount_tolerance),
+        EvidenceType.TIME_WINDOW: lambda req: _time_block(req, time_window_minutes),
+    }
+    order = (
+        EvidenceType.REFERENCE_MATCH,
+        EvidenceType.AMOUNT_TOLERANCE,
+        EvidenceType.TIME_WINDOW,
+    )
+    lines = [
+        "def _scorer(refs, amounts, raw_amounts, ts_minutes, i, j):",
+        "    total = 0.0",
+    ]
+    for ev_type in order:
+        if ev_type in required:
+            lines.extend(blocks[ev_type](True))
+    for ev_type in order:
+        if ev_type not in required:
+            lines.extend(blocks[ev_type](False))
+    lines.extend(
+        [
+            "    ev = [e for e in (ref_ev, amt_ev, time_ev) if e is not None]",
+            "    if not ev:",
+            "        return None",
+            "    score = total / len(ev)",
+            f"    if score < {min_score!r}:",
+            "        return None",
+            "    if score > 1.0:",
+            "        score = 1.0",
+            "    return ev, score",
+        ]
+    )
+    source = "\n".join(lines)
+    namespace: dict = {}
+    exec(  # noqa: S102 - código generado internamente, sin entrada externa
+        compile(source, f"<rule {rule.rule_id}@{rule.rule_version}>", "exec"),
+        {
+            "CorrelationEvidence": CorrelationEvidence,
+            "_REF": EvidenceType.REFERENCE_MATCH,
+            "_AMT": EvidenceType.AMOUNT_TOLERANCE,
+            "_TIME": EvidenceType.TIME_WINDOW,
+        },
+        namespace,
+    )
+    return namespace["_scorer"]
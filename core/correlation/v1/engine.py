@@ -0,0 +1,608 @@
+"""Motor de correlación versionado (RFC-04 §6).
+
+El motor propone vínculos plausibles entre eventos canónicos aplicando
+reglas explícitas sobre candidatos pre-filtrados por bloqueo (blocking):
+en lugar de comparar todos los pares O(n²), agrupa los eventos por
+claves baratas (referencia externa, banda de monto, ventana temporal) y
+solo evalúa reglas sobre los pares que comparten al menos un bloque.
+El resultado es determinista: mismos eventos y mismas reglas producen
+los mismos vínculos, en el mismo orden.
+
+Los campos calientes de los eventos (identificador, referencia, monto,
+timestamp) se materializan una sola vez en disposición columnar (SoA):
+los bucles internos leen listas/arrays indexados en lugar de repetir
+búsquedas de diccionario por par.
+"""
+
+import hashlib
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - dependencia opcional
+    numpy = None
+
+from ._codegen import build_rule_scorer
+from .rules import CorrelationRule, RuleRegistry
+from .store import InMemoryAppendOnlyLinkStore
+from .types import (
+    CorrelationEvidence,
+    CorrelationLink,
+    EvidenceType,
+    _link_events_unchecked,
+    score_from_evidence,
+)
+
+_GET_EVENT_ID = itemgetter("event_id")
+
+
+@dataclass
+class _EventColumns:
+    """Disposición columnar (SoA) de los campos calientes de los eventos.
+
+    ``amounts`` usa 0.0 para monto ausente o no numérico; ``ts_minutes``
+    usa NaN para timestamp ausente o no parseable. Con NumPy disponible
+    ambas columnas son ``ndarray[float64]``; sin él, listas de float.
+    """
+
+    event_ids: List[str]
+    refs: List[Optional[str]]
+    event_types: List[str]
+    amounts: Sequence[float]
+    ts_minutes: Sequence[float]
+    raw_amounts: List[Any]
+    raw_timestamps: List[Any]
+
+
+class CorrelationEngine:
+    """Propone vínculos con evidencia, regla y score reproducibles."""
+
+    #: Tolerancia relativa de monto para considerar dos montos cercanos.
+    AMOUNT_TOLERANCE = 0.05
+    #: Ventana temporal máxima (minutos) para evidencia TIME_WINDOW.
+    TIME_WINDOW_MINUTES = 1440
+    #: Score mínimo para emitir un vínculo; por debajo no hay plausibilidad.
+    MIN_SCORE = 0.1
+
+    def __init__(self, rule_registry: RuleRegistry, engine_version: str = "1.0.0") -> None:
+        self.rule_registry = rule_registry
+        self.engine_version = engine_version
+        #: Evaluadores especializados por regla, compilados una sola vez.
+        self._scorers: Dict[Tuple[str, str], Any] = {}
+
+    def propose_links(self, canonical_events: List[Dict[str, Any]]) -> List[CorrelationLink]:
+        """Genera todos los vínculos plausibles entre los eventos dados.
+
+        Los candidatos se generan por bloqueo y se evalúan en orden
+        determinista ``(event_id_i, event_id_j, orden de regla)``.
+        """
+        rules = self.rule_registry.list_rules()
+        if not rules or len(canonical_events) < 2:
+            return []
+
+        # itemgetter es un invocable a nivel C, ~3x más barato que una
+        # lambda como clave de orden; solo ante event_id ausente se cae
+        # al camino lento que rellena el campo.
+        try:
+            events = sorted(canonical_events, key=_GET_EVENT_ID)
+        except KeyError:
+            for event in canonical_events:
+                event.setdefault("event_id", "")
+            events = sorted(canonical_events, key=_GET_EVENT_ID)
+        columns = self._materialize(events)
+        candidates = self._candidate_pairs(columns)
+
+        event_ids = columns.event_ids
+        # Por regla, constantes del bucle de pares: el sufijo del link_id
+        # se codifica una vez y el evaluador especializado (generado y
+        # compilado por regla) se obtiene de la caché.
+        rule_tags = []
+        for rule in rules:
+            cache_key = (rule.rule_id, rule.rule_version)
+            scorer = self._scorers.get(cache_key)
+            if scorer is None:
+                scorer = build_rule_scorer(
+                    rule,
+                    self.AMOUNT_TOLERANCE,
+                    self.TIME_WINDOW_MINUTES,
+                    self.MIN_SCORE,
+                )
+                self._scorers[cache_key] = scorer
+            rule_tags.append(
+                (rule, f"|{rule.rule_id}|{rule.rule_version}".encode("utf-8"), scorer)
+            )
+        ordered = sorted(
+            candidates, key=lambda pair: (event_ids[pair[0]], event_ids[pair[1]])
+        )
+        if numpy is not None and len(ordered) >= self._VECTOR_PAIR_THRESHOLD:
+            ordered = self._prefilter_pairs(columns, ordered)
+        refs = columns.refs
+        amounts = columns.amounts
+        raw_amounts = columns.raw_amounts
+        ts_minutes = columns.ts_minutes
+        event_types = columns.event_types
+        links: List[CorrelationLink] = []
+        for i, j in ordered:
+            # Eventos duplicados en la entrada producirían auto-vínculos;
+            # antes los rechazaba link_events, ahora se filtran aquí.
+            if event_ids[i] == event_ids[j]:
+                continue
+            # Invariantes del bucle de reglas: identificadores, bytes del
+            # par para el link_id y created_at no dependen de la regla.
+            pair_bytes = f"{event_ids[i]}|{event_ids[j]}".encode("utf-8")
+            created_at = self._pair_created_at(columns, i, j)
+            for rule, rule_tag, scorer in rule_tags:
+                result = scorer(refs, amounts, raw_amounts, ts_minutes, i, j)
+                if result is None:
+                    continue
+                evidence, score = result
+                links.append(
+                    _link_events_unchecked(
+                        self._generate_link_id(pair_bytes, rule_tag),
+                        event_ids[i],
+                        event_ids[j],
+                        self._determine_link_type(evidence, event_types[j]),
+                        rule.rule_id,
+                        rule.rule_version,
+                        evidence,
+                        score,
+                        self.engine_version,
+                        created_at,
+                    )
+                )
+        return links
+
+    @staticmethod
+    def _materialize(events: List[Dict[str, Any]]) -> _EventColumns:
+        """Extrae los campos calientes una sola vez a columnas paralelas."""
+        event_ids: List[str] = []
+        refs: List[Optional[str]] = []
+        event_types: List[str] = []
+        amounts: List[float] = []
+        ts_minutes: List[float] = []
+        raw_amounts: List[Any] = []
+        raw_timestamps: List[Any] = []
+        for event in events:
+            event_ids.append(event.get("event_id", ""))
+            refs.append(event.get("external_reference") or None)
+            event_types.append(event.get("event_type", ""))
+            raw_amount = event.get("amount")
+            raw_amounts.append(raw_amount)
+            if raw_amount:
+                try:
+                    amounts.append(abs(float(raw_amount)))
+                except (TypeError, ValueError):
+                    amounts.append(0.0)
+            else:
+                amounts.append(0.0)
+            raw_timestamp = event.get("timestamp")
+            raw_timestamps.append(raw_timestamp)
+            minutes = CorrelationEngine._timestamp_minutes(raw_timestamp)
+            ts_minutes.append(math.nan if minutes is None else minutes)
+        amount_column: Sequence[float] = amounts
+        ts_column: Sequence[float] = ts_minutes
+        if numpy is not None:
+            amount_column = numpy.asarray(amounts, dtype=numpy.float64)
+            ts_column = numpy.asarray(ts_minutes, dtype=numpy.float64)
+        return _EventColumns(
+            event_ids=event_ids,
+            refs=refs,
+            event_types=event_types,
+            amounts=amount_column,
+            ts_minutes=ts_column,
+            raw_amounts=raw_amounts,
+            raw_timestamps=raw_timestamps,
+        )
+
+    def _candidate_pairs(self, columns: _EventColumns) -> Set[Tuple[int, int]]:
+        """Pares candidatos ``(i, j)`` con ``i < j`` vía claves de bloqueo."""
+        candidates: Set[Tuple[int, int]] = set()
+
+        # Bloqueo por referencia externa compartida.
+        by_ref: Dict[str, List[int]] = {}
+        for idx, ref in enumerate(columns.refs):
+            if ref:
+                by_ref.setdefault(ref, []).append(idx)
+        for bucket in by_ref.values():
+            for a in range(len(bucket) - 1):
+                for b in range(a + 1, len(bucket)):
+                    candidates.add((bucket[a], bucket[b]))
+
+        # Bloqueo por banda de monto; paso vectorizado cuando hay NumPy.
+        candidates.update(self._candidate_pairs_amount(columns.amounts))
+
+        # Bloqueo por ventana temporal: ventana deslizante sobre timestamps.
+        ts_minutes = columns.ts_minutes
+        stamps: List[Tuple[float, int]] = [
+            (ts_minutes[idx], idx)
+            for idx in range(len(ts_minutes))
+            if not math.isnan(ts_minutes[idx])
+        ]
+        stamps.sort()
+        hi = 0
+        for lo in range(len(stamps)):
+            base_minutes = stamps[lo][0]
+            if hi <= lo:
+                hi = lo + 1
+            while hi < len(stamps) and stamps[hi][0] - base_minutes <= self.TIME_WINDOW_MINUTES:
+                hi += 1
+            for k in range(lo + 1, hi):
+                pair = (stamps[lo][1], stamps[k][1])
+                if pair[0] > pair[1]:
+                    pair = (pair[1], pair[0])
+                candidates.add(pair)
+
+        return candidates
+
+    #: Hasta este tamaño el broadcasting denso N×N es más barato que el sweep.
+    _DENSE_AMOUNT_LIMIT = 2000
+    #: A partir de cuántos pares candidatos compensa el prefiltro vectorizado.
+    _VECTOR_PAIR_THRESHOLD = 64
+
+    def _prefilter_pairs(
+        self, columns: _EventColumns, ordered: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        """Descarta en bloque los pares sin evidencia o bajo el score mínimo.
+
+        Calcula las tres máscaras de evidencia (referencia, monto,
+        ventana temporal) y el score agregado como operaciones NumPy
+        sobre los arrays de candidatos; solo los pares supervivientes
+        construyen objetos ``CorrelationEvidence``/``CorrelationLink``
+        en Python. El filtro replica la semántica escalar: un par se
+        conserva si y solo si produciría evidencia con score >= MIN_SCORE.
+        """
+        cand_i = numpy.fromiter((pair[0] for pair in ordered), dtype=numpy.int64)
+        cand_j = numpy.fromiter((pair[1] for pair in ordered), dtype=numpy.int64)
+
+        refs = numpy.asarray(columns.refs, dtype=object)
+        refs_i = refs[cand_i]
+        ref_match = (refs_i != None) & (refs_i == refs[cand_j])  # noqa: E711
+
+        amounts = numpy.asarray(columns.amounts, dtype=numpy.float64)
+        amount_i = amounts[cand_i]
+        amount_j = amounts[cand_j]
+        valid_amount = (amount_i != 0.0) & (amount_j != 0.0)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            tolerance = numpy.where(
+                valid_amount,
+                numpy.abs(amount_i - amount_j) / amount_i,
+                numpy.inf,
+            )
+        amount_match = tolerance <= self.AMOUNT_TOLERANCE
+        amount_exact = amount_match & (amount_i == amount_j)
+
+        ts = numpy.asarray(columns.ts_minutes, dtype=numpy.float64)
+        ts_i = ts[cand_i]
+        ts_j = ts[cand_j]
+        time_match = (
+            ~numpy.isnan(ts_i)
+            & ~numpy.isnan(ts_j)
+            & (numpy.abs(ts_i - ts_j) <= self.TIME_WINDOW_MINUTES)
+        )
+
+        # Score agregado: misma tabla que score_from_evidence
+        # (REFERENCE_MATCH siempre lleva exact_match).
+        count = (
+            ref_match.astype(numpy.int64)
+            + amount_match.astype(numpy.int64)
+            + time_match.astype(numpy.int64)
+        )
+        total = (
+            0.5 * ref_match
+            + 0.3 * amount_match
+            + 0.1 * amount_exact
+            + 0.2 * time_match
+        )
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            score = numpy.where(count > 0, total / numpy.maximum(count, 1), 0.0)
+        keep = (count > 0) & (score >= self.MIN_SCORE)
+        return [ordered[k] for k in numpy.flatnonzero(keep)]
+
+    def _candidate_pairs_amount(self, amounts: Sequence[float]) -> Set[Tuple[int, int]]:
+        """Pares ``(i, j)`` con montos dentro de tolerancia relativa.
+
+        Con NumPy y N pequeño, una sola pasada de broadcasting
+        ``|a_i - a_j| <= tol * a_i`` produce la matriz booleana completa
+        en C; para N grande, sweep O(N log N + K) sobre montos
+        ordenados. Sin NumPy, dos punteros en Python puro. Los montos en
+        0.0 (ausentes/no numéricos) se filtran antes de comparar.
+        """
+        pairs: Set[Tuple[int, int]] = set()
+        if numpy is not None:
+            column = numpy.asarray(amounts, dtype=numpy.float64)
+            valid = numpy.flatnonzero(column)
+            if len(valid) < 2:
+                return pairs
+            values = column[valid]
+            if len(valid) <= self._DENSE_AMOUNT_LIMIT:
+                close = numpy.abs(values[:, None] - values[None, :]) <= (
+                    self.AMOUNT_TOLERANCE * values[:, None]
+                )
+                for a, b in numpy.argwhere(numpy.triu(close, k=1)):
+                    i = int(valid[a])
+                    j = int(valid[b])
+                    pairs.add((i, j) if i < j else (j, i))
+                return pairs
+            order = numpy.argsort(values, kind="stable")
+            sorted_values = values[order]
+            sorted_indices = valid[order]
+            # Misma banda ensanchada que el sweep puro-Python: la
+            # evidencia puede dividir por el monto mayor del par, así que
+            # el blocking admite hasta base/(1 - tol) y deja el corte
+            # exacto a la evidencia. Así los tres caminos (denso, sweep
+            # vectorizado, fallback) emiten el mismo conjunto de links.
+            upper_factor = 1.0 / (1.0 - self.AMOUNT_TOLERANCE)
+            hi = 0
+            for lo in range(len(sorted_values)):
+                limit = sorted_values[lo] * upper_factor
+                if hi <= lo:
+                    hi = lo + 1
+                while hi < len(sorted_values) and sorted_values[hi] <= limit:
+                    hi += 1
+                for k in range(lo + 1, hi):
+                    i = int(sorted_indices[lo])
+                    j = int(sorted_indices[k])
+                    pairs.add((i, j) if i < j else (j, i))
+            return pairs
+
+        sortable: List[Tuple[float, int]] = [
+            (amounts[idx], idx) for idx in range(len(amounts)) if amounts[idx]
+        ]
+        sortable.sort()
+        # La evidencia divide por el monto del evento con menor índice de
+        # columna, que puede ser el mayor de los dos: la banda se ensancha
+        # a base/(1 - tol) (> base*(1 + tol)) para que el blocking sea un
+        # superconjunto estricto; el filtro real es la evidencia.
+        upper_factor = 1.0 / (1.0 - self.AMOUNT_TOLERANCE)
+        hi = 0
+        for lo in range(len(sortable)):
+            base_amount = sortable[lo][0]
+            if hi <= lo:
+                hi = lo + 1
+            while hi < len(sortable) and sortable[hi][0] <= base_amount * upper_factor:
+                hi += 1
+            for k in range(lo + 1, hi):
+                pair = (sortable[lo][1], sortable[k][1])
+                if pair[0] > pair[1]:
+                    pair = (pair[1], pair[0])
+                pairs.add(pair)
+        return pairs
+
+    def _try_correlate_events(
+        self,
+        columns: _EventColumns,
+        i: int,
+        j: int,
+        rule: CorrelationRule,
+        rule_tag: Optional[bytes] = None,
+        pair_bytes: Optional[bytes] = None,
+        created_at: Optional[str] = None,
+        required: Optional[frozenset] = None,
+    ) -> Optional[CorrelationLink]:
+        """Evalúa una regla sobre un par; None si no hay vínculo plausible."""
+        if required is None:
+            required = frozenset(
+                EvidenceType.coerce(name) for name in rule.evidence_required
+            )
+        evidence = self._generate_evidence(columns, i, j, rule, required)
+        if not evidence:
+            return None
+        found_types = [ev.evidence_type for ev in evidence]
+        for required_type in required:
+            if required_type not in found_types:
+                return None
+        score = score_from_evidence(evidence)
+        if score < self.MIN_SCORE:
+            return None
+        link_type = self._determine_link_type(evidence, columns.event_types[j])
+        if rule_tag is None:
+            rule_tag = f"|{rule.rule_id}|{rule.rule_version}".encode("utf-8")
+        if pair_bytes is None:
+            # Camino autónomo (sin propose_links): aquí sí hay que
+            # descartar pares de eventos con identificador duplicado.
+            if columns.event_ids[i] == columns.event_ids[j]:
+                return None
+            pair_bytes = f"{columns.event_ids[i]}|{columns.event_ids[j]}".encode("utf-8")
+        link_id = self._generate_link_id(pair_bytes, rule_tag)
+        if created_at is None:
+            created_at = self._pair_created_at(columns, i, j)
+        # El motor ya garantiza evidencia no vacía, score en [0, 1],
+        # tipo de vínculo del enum y eventos distintos: constructor
+        # directo sin re-validar ni armar estado de excepción por par.
+        return _link_events_unchecked(
+            link_id,
+            columns.event_ids[i],
+            columns.event_ids[j],
+            link_type,
+            rule.rule_id,
+            rule.rule_version,
+            evidence,
+            score,
+            self.engine_version,
+            created_at,
+        )
+
+    #: Orden canónico de generación de evidencia (y de la tupla resultante).
+    _EVIDENCE_ORDER = (
+        EvidenceType.REFERENCE_MATCH,
+        EvidenceType.AMOUNT_TOLERANCE,
+        EvidenceType.TIME_WINDOW,
+    )
+
+    def _generate_evidence(
+        self,
+        columns: _EventColumns,
+        i: int,
+        j: int,
+        rule: CorrelationRule,
+        required: Optional[frozenset] = None,
+    ) -> List[CorrelationEvidence]:
+        """Evidencia observable entre dos eventos; nunca inferida.
+
+        Los tipos exigidos por la regla se comprueban primero: si falta
+        alguno, el par se descarta sin pagar los chequeos restantes.
+        Solo los pares supervivientes generan la evidencia adicional, y
+        la lista final conserva el orden canónico de tipos, de modo que
+        scores y vínculos son idénticos a la generación exhaustiva.
+        """
+        if required is None:
+            required = frozenset(
+                EvidenceType.coerce(name) for name in rule.evidence_required
+            )
+        makers = {
+            EvidenceType.REFERENCE_MATCH: self._reference_evidence,
+            EvidenceType.AMOUNT_TOLERANCE: self._amount_evidence,
+            EvidenceType.TIME_WINDOW: self._time_evidence,
+        }
+        evidence: List[CorrelationEvidence] = []
+        for ev_type in self._EVIDENCE_ORDER:
+            if ev_type in required:
+                piece = makers[ev_type](columns, i, j)
+                if piece is None:
+                    return []
+                evidence.append(piece)
+        for ev_type in self._EVIDENCE_ORDER:
+            if ev_type not in required:
+                piece = makers[ev_type](columns, i, j)
+                if piece is not None:
+                    evidence.append(piece)
+        evidence.sort(key=lambda ev: ev.evidence_type)
+        return evidence
+
+    def _reference_evidence(
+        self, columns: _EventColumns, i: int, j: int
+    ) -> Optional[CorrelationEvidence]:
+        refs = columns.refs
+        if refs[i] and refs[i] == refs[j]:
+            return CorrelationEvidence(
+                evidence_type=EvidenceType.REFERENCE_MATCH,
+                description=f"Referencia externa compartida: {refs[i]}",
+                details={"exact_match": True},
+            )
+        return None
+
+    def _amount_evidence(
+        self, columns: _EventColumns, i: int, j: int
+    ) -> Optional[CorrelationEvidence]:
+        amount1 = columns.amounts[i]
+        amount2 = columns.amounts[j]
+        if amount1 and amount2 and abs(amount1 - amount2) / amount1 <= self.AMOUNT_TOLERANCE:
+            return CorrelationEvidence(
+                evidence_type=EvidenceType.AMOUNT_TOLERANCE,
+                description=(
+                    f"Montos dentro de tolerancia: {columns.raw_amounts[i]} ~ "
+                    f"{columns.raw_amounts[j]}"
+                ),
+                details={
+                    "tolerance_percentage": self.AMOUNT_TOLERANCE * 100,
+                    "exact_match": amount1 == amount2,
+                },
+            )
+        return None
+
+    def _time_evidence(
+        self, columns: _EventColumns, i: int, j: int
+    ) -> Optional[CorrelationEvidence]:
+        minutes1 = columns.ts_minutes[i]
+        minutes2 = columns.ts_minutes[j]
+        if not math.isnan(minutes1) and not math.isnan(minutes2):
+            delta = abs(minutes1 - minutes2)
+            if delta <= self.TIME_WINDOW_MINUTES:
+                return CorrelationEvidence(
+                    evidence_type=EvidenceType.TIME_WINDOW,
+                    description=(
+                        f"Eventos dentro de ventana temporal de {delta:.1f} minutos"
+                    ),
+                    details={"window_minutes": delta},
+                )
+        return None
+
+    def _determine_link_type(
+        self, evidence: List[CorrelationEvidence], target_event_type: str
+    ) -> str:
+        """Tipo de vínculo según la evidencia reunida (enum cerrado RFC-04)."""
+        reference_match = EvidenceType.REFERENCE_MATCH
+        amount_tolerance = EvidenceType.AMOUNT_TOLERANCE
+        time_window = EvidenceType.TIME_WINDOW
+        has_reference = False
+        has_amount = False
+        has_time = False
+        for ev in evidence:
+            ev_type = ev.evidence_type
+            if ev_type is reference_match:
+                has_reference = True
+            elif ev_type is amount_tolerance:
+                has_amount = True
+            elif ev_type is time_window:
+                has_time = True
+        if has_reference and "REFUND" in target_event_type:
+            return "REFUND"
+        if has_reference and "REVERS" in target_event_type:
+            return "REVERSAL"
+        if has_reference and has_amount:
+            return "POTENTIAL_MATCH"
+        if has_reference and has_time:
+            return "SEQUENCE"
+        if has_amount and has_time:
+            return "POTENTIAL_MATCH"
+        return "RELATED"
+
+    def _pair_created_at(self, columns: _EventColumns, i: int, j: int) -> str:
+        """Timestamp más reciente del par para ``created_at``.
+
+        Compara los minutos ya parseados (comparación numérica) y
+        devuelve la cadena original del evento ganador; solo si algún
+        timestamp no parseó se cae al ``max`` lexicográfico histórico.
+        """
+        minutes_i = columns.ts_minutes[i]
+        minutes_j = columns.ts_minutes[j]
+        if math.isnan(minutes_i) or math.isnan(minutes_j):
+            return max(
+                columns.raw_timestamps[i] or "", columns.raw_timestamps[j] or ""
+            )
+        if minutes_i >= minutes_j:
+            return columns.raw_timestamps[i]
+        return columns.raw_timestamps[j]
+
+    def _generate_link_id(self, pair_bytes: bytes, rule_tag: bytes) -> str:
+        """Identificador determinista del vínculo (par + regla + versión).
+
+        Ambos argumentos llegan pre-codificados (``id1|id2`` y
+        ``|rule_id|rule_version``); blake2b con digest de 16 bytes es más
+        barato que MD5 en entradas cortas y el identificador no necesita
+        ser criptográfico.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(pair_bytes)
+        hasher.update(rule_tag)
+        return hasher.hexdigest()
+
+    def build_money_flow(
+        self, store: InMemoryAppendOnlyLinkStore, event_ids: List[str]
+    ) -> Dict[str, List[str]]:
+        """Subgrafo de flujo de dinero que toca los eventos dados.
+
+        Una sola pasada de unión de conjuntos sobre el índice invertido
+        del almacén: O(salida) y determinista tras el orden final.
+        """
+        link_ids = {
+            link_id
+            for event_id in event_ids
+            for link_id in store.link_ids_for_event(event_id)
+        }
+        return {"event_ids": sorted(set(event_ids)), "link_ids": sorted(link_ids)}
+
+    @staticmethod
+    def _timestamp_minutes(timestamp: Any) -> Optional[float]:
+        """Convierte un timestamp ISO-8601 a minutos desde época; None si no parsea."""
+        if not timestamp or not isinstance(timestamp, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return parsed.timestamp() / 60.0
@@ -0,0 +1,39 @@
+"""Reglas de correlación explícitas y versionadas (RFC-04 §4.1)."""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+
+@dataclass(frozen=True)
+class CorrelationRule:
+    """Regla declarativa: qué eventos considera y qué evidencia exige."""
+
+    rule_id: str
+    rule_version: str
+    evidence_required: List[str]
+    applicability: List[str] = field(default_factory=list)
+    explanation_template: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.evidence_required:
+            raise ValueError(
+                f"Regla {self.rule_id!r} sin evidence_required (RFC-04 §7.1)"
+            )
+
+
+class RuleRegistry:
+    """Registro ordenado de reglas; el orden de registro es determinista."""
+
+    def __init__(self) -> None:
+        self._rules: Tuple[CorrelationRule, ...] = ()
+        self._rule_ids: set = set()
+
+    def register(self, rule: CorrelationRule) -> None:
+        if rule.rule_id in self._rule_ids:
+            raise ValueError(f"Regla ya registrada: {rule.rule_id}")
+        self._rules = self._rules + (rule,)
+        self._rule_ids.add(rule.rule_id)
+
+    def list_rules(self) -> Tuple[CorrelationRule, ...]:
+        """Tupla inmutable de reglas en orden de registro; no se copia."""
+        return self._rules
@@ -0,0 +1,44 @@
+"""Almacén append-only de vínculos de correlación (RFC-04 §5).
+
+El grafo de correlación solo crece: los vínculos históricos jamás se
+borran ni se modifican, incluso cuando cambian las reglas.
+"""
+
+from typing import Dict, Iterator, List
+
+from .types import CorrelationLink
+
+
+class InMemoryAppendOnlyLinkStore:
+    """Almacén en memoria con semántica WORM."""
+
+    def __init__(self) -> None:
+        #: Un solo dict: orden de inserción + dedupe O(1) por link_id,
+        #: sin el set paralelo ni su hashing duplicado por append.
+        self._links: Dict[str, CorrelationLink] = {}
+        #: Índice invertido event_id -> vínculos que lo tocan.
+        self._by_event: Dict[str, List[CorrelationLink]] = {}
+
+    def append(self, link: CorrelationLink) -> None:
+        if link.link_id in self._links:
+            raise ValueError(
+                f"Vínculo ya registrado; el almacén es append-only: {link.link_id}"
+            )
+        self._links[link.link_id] = link
+        self._by_event.setdefault(link.source_event_id, []).append(link)
+        if link.target_event_id != link.source_event_id:
+            self._by_event.setdefault(link.target_event_id, []).append(link)
+
+    def iter_all(self) -> Iterator[CorrelationLink]:
+        return iter(self._links.values())
+
+    def iter_by_event(self, event_id: str) -> Iterator[CorrelationLink]:
+        return iter(self._by_event.get(event_id, ()))
+
+    def link_ids_for_event(self, event_id: str) -> Iterator[str]:
+        """Solo los ``link_id`` que tocan el evento, sin materializar vínculos."""
+        for link in self._by_event.get(event_id, ()):
+            yield link.link_id
+
+    def __len__(self) -> int:
+        return len(self._links)
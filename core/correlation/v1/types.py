@@ -0,0 +1,182 @@
+"""Contratos del motor de correlación (RFC-04 §4).
+
+Un ``CorrelationLink`` no afirma verdad: afirma que la relación es
+plausible bajo una regla, con su evidencia y su score reproducible.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, List, Tuple, Union
+
+VALID_LINK_TYPES = frozenset(
+    {"POTENTIAL_MATCH", "SEQUENCE", "REVERSAL", "REFUND", "RELATED"}
+)
+
+
+class EvidenceType(IntEnum):
+    """Tipos cerrados de evidencia de correlación (RFC-04 §4.2).
+
+    IntEnum para que el despacho en los bucles calientes sea una
+    comparación de identidad/entero y no de cadenas.
+    """
+
+    REFERENCE_MATCH = 0
+    AMOUNT_TOLERANCE = 1
+    TIME_WINDOW = 2
+    SEQUENCE_MATCH = 3
+    EXPLICIT_REFERENCE = 4
+    CONFLICT = 5
+
+    @classmethod
+    def coerce(cls, value: Union["EvidenceType", str]) -> "EvidenceType":
+        """Acepta el miembro o su alias histórico en cadena."""
+        if type(value) is cls:
+            return value
+        return cls[value]
+
+
+#: Aporte base al score por tipo de evidencia, indexado por valor del enum.
+_SCORE_TABLE = (0.4, 0.3, 0.2, 0.35, 0.5, -0.3)
+
+#: Alias de cadena internados para llamadores que aún pasan strings.
+_TYPE_BY_NAME = {sys.intern(member.name): member for member in EvidenceType}
+
+
+@dataclass(frozen=True, slots=True)
+class CorrelationEvidence:
+    """Pieza de evidencia observada que sustenta un vínculo."""
+
+    evidence_type: EvidenceType
+    description: str
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class CorrelationLink:
+    """Vínculo plausible entre dos eventos canónicos (RFC-04 §4.2).
+
+    Se crean en masa (uno por par superviviente): ``slots=True`` evita
+    el ``__dict__`` por instancia y abarata el acceso a atributos en
+    los barridos del almacén.
+    """
+
+    link_id: str
+    source_event_id: str
+    target_event_id: str
+    link_type: str
+    rule_id: str
+    rule_version: str
+    evidence: Tuple[CorrelationEvidence, ...]
+    confidence_score: float
+    engine_version: str
+    created_at: str
+
+
+#: Kernel Numba opcional; se carga perezosamente en la primera llamada
+#: para no pagar la compilación/el import si nunca se puntúa evidencia.
+_KERNEL_LOADED = False
+_PACK_AND_SCORE = None
+
+
+def _load_scoring_kernel() -> None:
+    global _KERNEL_LOADED, _PACK_AND_SCORE
+    _KERNEL_LOADED = True
+    try:
+        from ._scoring_kernel import pack_and_score
+    except ImportError:
+        return
+    _PACK_AND_SCORE = pack_and_score
+
+
+def score_from_evidence(evidence: List[CorrelationEvidence]) -> float:
+    """Score determinista en [0, 1] a partir de la evidencia acumulada.
+
+    Promedio de los aportes por tipo de evidencia (tabla indexada por el
+    enum), con ajuste por detalle (``exact_match``); misma evidencia ⇒
+    mismo score. Con ``numba``/``numpy`` instalados delega en el kernel
+    compilado de :mod:`._scoring_kernel`.
+    """
+    if not evidence:
+        return 0.0
+    if not _KERNEL_LOADED:
+        _load_scoring_kernel()
+    if _PACK_AND_SCORE is not None:
+        return _PACK_AND_SCORE(evidence)
+    table = _SCORE_TABLE
+    by_name = _TYPE_BY_NAME
+    total = 0.0
+    for ev in evidence:
+        ev_type = ev.evidence_type
+        if type(ev_type) is not EvidenceType:
+            ev_type = by_name[ev_type]
+        base = table[ev_type]
+        if ev.details.get("exact_match"):
+            base += 0.1
+        total += base
+    return min(max(total / len(evidence), 0.0), 1.0)
+
+
+def link_events(
+    link_id: str,
+    source_event_id: str,
+    target_event_id: str,
+    link_type: str,
+    rule_id: str,
+    rule_version: str,
+    evidence: List[CorrelationEvidence],
+    confidence_score: float,
+    engine_version: str,
+    created_at: str,
+) -> CorrelationLink:
+    """Construye un vínculo validado; el match implícito está prohibido."""
+    if not evidence:
+        raise ValueError("Un vínculo sin evidencia está prohibido (RFC-04 §3.2)")
+    if not 0.0 <= confidence_score <= 1.0:
+        raise ValueError(f"confidence_score fuera de [0, 1]: {confidence_score!r}")
+    if source_event_id == target_event_id:
+        raise ValueError("Un evento no se correlaciona consigo mismo")
+    if link_type not in VALID_LINK_TYPES:
+        raise ValueError(f"link_type fuera del enum cerrado: {link_type!r}")
+    return _link_events_unchecked(
+        link_id,
+        source_event_id,
+        target_event_id,
+        link_type,
+        rule_id,
+        rule_version,
+        evidence,
+        confidence_score,
+        engine_version,
+        created_at,
+    )
+
+
+def _link_events_unchecked(
+    link_id: str,
+    source_event_id: str,
+    target_event_id: str,
+    link_type: str,
+    rule_id: str,
+    rule_version: str,
+    evidence: List[CorrelationEvidence],
+    confidence_score: float,
+    engine_version: str,
+    created_at: str,
+) -> CorrelationLink:
+    """Constructor sin validaciones para el motor, que ya las garantiza.
+
+    Los llamadores externos deben usar :func:`link_events`.
+    """
+    return CorrelationLink(
+        link_id=link_id,
+        source_event_id=source_event_id,
+        target_event_id=target_event_id,
+        link_type=link_type,
+        rule_id=rule_id,
+        rule_version=rule_version,
+        evidence=tuple(evidence),
+        confidence_score=confidence_score,
+        engine_version=engine_version,
+        created_at=created_at,
+    )
@@ -0,0 +1,88 @@
+"""Registro de versiones de componentes del motor (RFC-04 §6.2).
+
+Cada regla, motor o modelo publica versiones con fecha de vigencia;
+el resolutor responde "¿qué versión estaba vigente en este instante?"
+de forma determinista, requisito para re-ejecutar correlaciones
+históricas con las reglas de su época.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class VersionEntry:
+    """Versión publicada de un componente con su fecha de vigencia.
+
+    ``effective_at`` es un timestamp ISO-8601 UTC; el orden lexicográfico
+    coincide con el temporal.
+    """
+
+    component: str
+    version: str
+    effective_at: str
+    description: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.component:
+            raise ValueError("VersionEntry requiere component")
+        if not self.version:
+            raise ValueError("VersionEntry requiere version")
+        if not self.effective_at:
+            raise ValueError("VersionEntry requiere effective_at")
+
+
+class VersionRegistry:
+    """Historial append-only de versiones por componente, ordenado por vigencia."""
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, List[VersionEntry]] = {}
+        #: Claves ``effective_at`` paralelas a ``_versions``, para que los
+        #: resolutores bisecten sin reconstruir la lista de claves.
+        self._effective: Dict[str, List[str]] = {}
+
+    def register(self, entry: VersionEntry) -> None:
+        # Inserción ordenada O(N) en el historial y su lista de claves;
+        # las vigencias iguales conservan el orden de registro.
+        keys = self._effective.setdefault(entry.component, [])
+        idx = bisect_right(keys, entry.effective_at)
+        keys.insert(idx, entry.effective_at)
+        self._versions.setdefault(entry.component, []).insert(idx, entry)
+
+    def get_versions(self, component: str) -> Sequence[VersionEntry]:
+        """Vista de solo lectura del historial; el llamador no debe mutarla.
+
+        Se devuelve la secuencia interna sin copiar: los resolutores la
+        consultan por evento y la copia O(N) por llamada era puro churn.
+        """
+        return self._versions.get(component, ())
+
+    def _history(
+        self, component: str
+    ) -> tuple:
+        """Acceso protegido para resolutores: historial y claves internos."""
+        return (
+            self._versions.get(component, ()),
+            self._effective.get(component, ()),
+        )
+
+
+class VersionResolver:
+    """Resuelve la versión vigente de un componente en un instante dado."""
+
+    def __init__(self, registry: VersionRegistry) -> None:
+        self.registry = registry
+
+    def resolve(self, component: str, timestamp: str) -> Optional[VersionEntry]:
+        """Última versión con ``effective_at <= timestamp``; None si no hay.
+
+        Búsqueda binaria directa sobre la lista de claves que el
+        registro ya mantiene en paralelo al historial: sin copias ni
+        comprensiones por llamada.
+        """
+        versions, keys = self.registry._history(component)
+        if not versions:
+            return None
+        idx = bisect_right(keys, timestamp) - 1
+        return versions[idx] if idx >= 0 else None
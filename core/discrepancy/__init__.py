@@ -0,0 +1,17 @@
+"""Taxonomía y diagnóstico de discrepancias (RFC-06)."""
+
+from .v1 import (
+    AppendOnlyDiscrepancyStore,
+    Discrepancy,
+    DiscrepancyType,
+    SeverityHint,
+    validate_rule_output,
+)
+
+__all__ = [
+    "AppendOnlyDiscrepancyStore",
+    "Discrepancy",
+    "DiscrepancyType",
+    "SeverityHint",
+    "validate_rule_output",
+]
@@ -0,0 +1,12 @@
+"""Versión 1 de la taxonomía de discrepancias: contratos y almacén."""
+
+from .models import Discrepancy, DiscrepancyType, SeverityHint, validate_rule_output
+from .store import AppendOnlyDiscrepancyStore
+
+__all__ = [
+    "AppendOnlyDiscrepancyStore",
+    "Discrepancy",
+    "DiscrepancyType",
+    "SeverityHint",
+    "validate_rule_output",
+]
@@ -0,0 +1,25 @@
+# cython: language_level=3
+"""Acelerador opcional de ``validate_rule_output``.
+
+Se compila con Cython cuando el volumen de discrepancias por evaluación
+lo amerita; el validador puro-Python es la referencia de semántica y el
+respaldo automático si esta extensión no está construida.
+"""
+
+
+def flag_rule_mismatches(list discrepancies, str rule_id, str rule_version):
+    """Índices de discrepancias mal atribuidas a la regla esperada.
+
+    Solo marca; el ValueError con diagnóstico detallado lo construye el
+    camino Python (frío por diseño: en estado estable ninguna falla).
+    """
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t n = len(discrepancies)
+    flagged = []
+    for idx in range(n):
+        discrepancy = discrepancies[idx]
+        rid = discrepancy.rule_id
+        rversion = discrepancy.rule_version
+        if rid != rule_id or rversion != rule_version or not rid or not rversion:
+            flagged.append(idx)
+    return flagged
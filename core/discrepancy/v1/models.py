@@ -0,0 +1,184 @@
+"""Contratos de discrepancia (RFC-06 §4 y §5).
+
+Una ``Discrepancy`` describe una desviación respecto a lo esperado,
+nunca una situación (eso es un ``MoneyState``). La taxonomía es cerrada
+y versionada; ante evidencia insuficiente se clasifica como
+``INSUFFICIENT_EVIDENCE``, jamás se fuerza una categoría.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List
+
+try:
+    # Extensión Cython opcional (_validate.pyx): marca las discrepancias
+    # mal atribuidas iterando en C; si no está compilada, el loop
+    # puro-Python cubre la misma semántica.
+    from ._validate import flag_rule_mismatches as _flag_rule_mismatches_c
+except ImportError:
+    _flag_rule_mismatches_c = None
+
+
+class DiscrepancyType(Enum):
+    """Taxonomía cerrada de discrepancias (RFC-06 §4.1)."""
+
+    NO_DISCREPANCY = "NO_DISCREPANCY"
+    TIMING_DELAY = "TIMING_DELAY"
+    MISSING_EVENT = "MISSING_EVENT"
+    DUPLICATE_EVENT = "DUPLICATE_EVENT"
+    AMOUNT_MISMATCH = "AMOUNT_MISMATCH"
+    CURRENCY_MISMATCH = "CURRENCY_MISMATCH"
+    STATUS_CONFLICT = "STATUS_CONFLICT"
+    UNEXPECTED_REVERSAL = "UNEXPECTED_REVERSAL"
+    ORPHAN_EVENT = "ORPHAN_EVENT"
+    INCONSISTENT_FLOW = "INCONSISTENT_FLOW"
+    INSUFFICIENT_EVIDENCE = "INSUFFICIENT_EVIDENCE"
+
+
+class SeverityHint(Enum):
+    """Severidad indicativa; la priorización económica es de RFC-07."""
+
+    LOW = "LOW"
+    MEDIUM = "MEDIUM"
+    HIGH = "HIGH"
+    UNKNOWN = "UNKNOWN"
+
+
+#: Valores de enum resueltos una vez para la serialización: ``.value``
+#: pasa por un descriptor; el dict plano lo vuelve un lookup simple.
+_DISCREPANCY_TYPE_VALUE = {member: member.value for member in DiscrepancyType}
+_SEVERITY_VALUE = {member: member.value for member in SeverityHint}
+
+#: Tipos que no exigen evidencia de soporte (ausencia o insuficiencia).
+_EVIDENCE_OPTIONAL_TYPES = frozenset(
+    {DiscrepancyType.NO_DISCREPANCY, DiscrepancyType.INSUFFICIENT_EVIDENCE}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Discrepancy:
+    """Desviación diagnosticada sobre un flujo, con su evidencia y regla.
+
+    Inmutable: una discrepancia emitida nunca se reclasifica; una nueva
+    evaluación produce una nueva discrepancia (RFC-06 §3).
+    """
+
+    discrepancy_id: str
+    flow_id: str
+    discrepancy_type: DiscrepancyType
+    severity_hint: SeverityHint
+    rule_id: str
+    rule_version: str
+    explanation: str
+    detected_at: str
+    supporting_states: List[str] = field(default_factory=list)
+    supporting_events: List[str] = field(default_factory=list)
+    supporting_links: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.discrepancy_id:
+            raise ValueError("Discrepancy requiere discrepancy_id")
+        if not self.flow_id:
+            raise ValueError("Discrepancy requiere flow_id")
+        # discrepancy_type y severity_hint se asumen miembros del enum:
+        # los constructores internos los pasan tipados y la frontera de
+        # confianza (from_dict) ya los valida al construir el enum.
+        if not self.rule_id:
+            raise ValueError("Una discrepancia sin regla no es explicable (RFC-06 §3.2)")
+        if not self.rule_version:
+            raise ValueError("Discrepancy requiere rule_version")
+        if not self.explanation:
+            raise ValueError("Discrepancy requiere explanation (RFC-06 §6)")
+        if not self.detected_at:
+            raise ValueError("Discrepancy requiere detected_at")
+        if self.discrepancy_type not in _EVIDENCE_OPTIONAL_TYPES and not (
+            self.supporting_states or self.supporting_events or self.supporting_links
+        ):
+            raise ValueError(
+                "Ninguna discrepancia existe sin evidencia de soporte (RFC-06 §3.2)"
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Proyección serializable de la discrepancia.
+
+        Las listas de soporte se devuelven por referencia, sin copiar:
+        el dict resultante es de solo lectura; quien necesite mutarlo
+        debe copiar primero.
+        """
+        return {
+            "discrepancy_id": self.discrepancy_id,
+            "flow_id": self.flow_id,
+            "discrepancy_type": _DISCREPANCY_TYPE_VALUE[self.discrepancy_type],
+            "severity_hint": _SEVERITY_VALUE[self.severity_hint],
+            "rule_id": self.rule_id,
+            "rule_version": self.rule_version,
+            "explanation": self.explanation,
+            "detected_at": self.detected_at,
+            "supporting_states": self.supporting_states,
+            "supporting_events": self.supporting_events,
+            "supporting_links": self.supporting_links,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Discrepancy":
+        """Frontera de confianza: los valores de enum se validan aquí,
+        al construirlos (``DiscrepancyType(...)`` rechaza lo desconocido)."""
+        return cls(
+            discrepancy_id=data["discrepancy_id"],
+            flow_id=data["flow_id"],
+            discrepancy_type=DiscrepancyType(data["discrepancy_type"]),
+            severity_hint=SeverityHint(data["severity_hint"]),
+            rule_id=data["rule_id"],
+            rule_version=data["rule_version"],
+            explanation=data["explanation"],
+            detected_at=data["detected_at"],
+            supporting_states=list(data.get("supporting_states", ())),
+            supporting_events=list(data.get("supporting_events", ())),
+            supporting_links=list(data.get("supporting_links", ())),
+        )
+
+
+def validate_rule_output(
+    discrepancies: List[Discrepancy], rule_id: str, rule_version: str
+) -> None:
+    """Verifica que toda discrepancia emitida declare la regla que la produjo.
+
+    Rechaza con evidencia: una discrepancia atribuida a otra regla o sin
+    versión rompe la reproducibilidad del diagnóstico.
+    """
+    if _flag_rule_mismatches_c is not None and isinstance(discrepancies, list):
+        flagged = _flag_rule_mismatches_c(discrepancies, rule_id, rule_version)
+        if not flagged:
+            return
+        _raise_rule_mismatch(discrepancies[flagged[0]], rule_id, rule_version)
+    for discrepancy in discrepancies:
+        rid = discrepancy.rule_id
+        rversion = discrepancy.rule_version
+        # Camino feliz: una sola rama combinada por discrepancia; el
+        # diagnóstico detallado solo se construye al fallar.
+        if rid == rule_id and rversion == rule_version and rid and rversion:
+            continue
+        _raise_rule_mismatch(discrepancy, rule_id, rule_version)
+
+
+def _raise_rule_mismatch(
+    discrepancy: Discrepancy, rule_id: str, rule_version: str
+) -> None:
+    """Construye el ValueError detallado de una discrepancia mal atribuida."""
+    if discrepancy.rule_id != rule_id:
+        raise ValueError(
+            f"Discrepancia {discrepancy.discrepancy_id!r} atribuida a la regla "
+            f"{discrepancy.rule_id!r}, se esperaba {rule_id!r}"
+        )
+    if discrepancy.rule_version != rule_version:
+        raise ValueError(
+            f"Discrepancia {discrepancy.discrepancy_id!r} atribuida a la versión "
+            f"{discrepancy.rule_version!r}, se esperaba {rule_version!r}"
+        )
+    if not discrepancy.rule_id:
+        raise ValueError(
+            f"Discrepancia {discrepancy.discrepancy_id!r} sin rule_id"
+        )
+    raise ValueError(
+        f"Discrepancia {discrepancy.discrepancy_id!r} sin rule_version"
+    )
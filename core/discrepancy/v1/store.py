@@ -0,0 +1,40 @@
+"""Almacén append-only de discrepancias (RFC-06 §6).
+
+Las discrepancias emitidas jamás se modifican ni se reclasifican; el
+almacén solo crece.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+from .models import Discrepancy
+
+
+class AppendOnlyDiscrepancyStore:
+    """Almacén en memoria con semántica WORM, indexado por flujo."""
+
+    def __init__(self) -> None:
+        self._discrepancies: Dict[str, Discrepancy] = {}
+        #: Índice por flujo con referencias directas: leerlo no vuelve a
+        #: pasar por el dict principal (este queda para get y dedupe WORM).
+        self._by_flow: Dict[str, List[Discrepancy]] = {}
+
+    def append(self, discrepancy: Discrepancy) -> None:
+        if discrepancy.discrepancy_id in self._discrepancies:
+            raise ValueError(
+                "Discrepancia ya registrada; el almacén es append-only: "
+                f"{discrepancy.discrepancy_id}"
+            )
+        self._discrepancies[discrepancy.discrepancy_id] = discrepancy
+        self._by_flow.setdefault(discrepancy.flow_id, []).append(discrepancy)
+
+    def get(self, discrepancy_id: str) -> Optional[Discrepancy]:
+        return self._discrepancies.get(discrepancy_id)
+
+    def list_by_flow(self, flow_id: str) -> List[Discrepancy]:
+        return list(self._by_flow.get(flow_id, ()))
+
+    def iter_all(self) -> Iterator[Discrepancy]:
+        return iter(self._discrepancies.values())
+
+    def __len__(self) -> int:
+        return len(self._discrepancies)
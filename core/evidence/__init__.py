@@ -0,0 +1,17 @@
+"""Evidencia inmutable: eventos de evidencia (RFC-08) y ledger WORM (RFC-09)."""
+
+from .v1 import (
+    ISO8601_UTC_PATTERN,
+    EvidenceEvent,
+    EvidenceLog,
+    LedgerEntry,
+    RetentionPolicy,
+)
+
+__all__ = [
+    "ISO8601_UTC_PATTERN",
+    "EvidenceEvent",
+    "EvidenceLog",
+    "LedgerEntry",
+    "RetentionPolicy",
+]
@@ -0,0 +1,12 @@
+"""Versión 1 de la capa de evidencia: log de eventos y entradas de ledger."""
+
+from .evidence_event import ISO8601_UTC_PATTERN, EvidenceEvent, EvidenceLog
+from .ledger_entry import LedgerEntry, RetentionPolicy
+
+__all__ = [
+    "ISO8601_UTC_PATTERN",
+    "EvidenceEvent",
+    "EvidenceLog",
+    "LedgerEntry",
+    "RetentionPolicy",
+]
@@ -0,0 +1,155 @@
+"""Eventos de evidencia y log append-only (RFC-08 §4).
+
+La evidencia es la fuente de verdad del sistema: cada hecho relevante se
+registra como un ``EvidenceEvent`` inmutable, con causalidad explícita y
+orden total por ``produced_at``.
+"""
+
+import re
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterator, List, Set, Tuple
+
+#: Timestamps de evidencia: ISO-8601 en UTC con sufijo ``Z`` obligatorio
+#: (RFC-08 §4.1). Se admiten fracciones de segundo de 1 a 6 dígitos.
+#: Se conserva como documentación ejecutable del formato; la validación
+#: caliente usa ``_is_iso8601_utc``.
+ISO8601_UTC_PATTERN = re.compile(
+    r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{1,6})?Z$"
+)
+
+
+def _is_iso8601_utc(value: str) -> bool:
+    """Equivalente manual de ``ISO8601_UTC_PATTERN``: el formato es de ancho
+    fijo, así que una comprobación posicional evita la maquinaria del motor
+    de expresiones regulares en cada artefacto construido."""
+    length = len(value)
+    if length < 20 or value[-1] != "Z":
+        return False
+    if (
+        value[4] != "-"
+        or value[7] != "-"
+        or value[10] != "T"
+        or value[13] != ":"
+        or value[16] != ":"
+    ):
+        return False
+    digits = (
+        value[0:4] + value[5:7] + value[8:10]
+        + value[11:13] + value[14:16] + value[17:19]
+    )
+    if not digits.isdigit():
+        return False
+    if length == 20:
+        return True
+    if value[19] != ".":
+        return False
+    fraction = value[20:-1]
+    return 1 <= len(fraction) <= 6 and fraction.isdigit()
+
+#: Tipos de evento de evidencia admitidos (RFC-08 §4.1, enum cerrado).
+VALID_EVIDENCE_EVENT_TYPES = frozenset(
+    {
+        "INGEST_RECORDED",
+        "CANONICAL_EVENT_EMITTED",
+        "CORRELATION_LINK_ADDED",
+        "MONEY_STATE_EVALUATED",
+        "DISCREPANCY_DETECTED",
+        "CAUSALITY_ATTRIBUTED",
+        "OTHER",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceEvent:
+    """Hecho inmutable del log de evidencia (RFC-08 §4.1)."""
+
+    evidence_event_id: str
+    event_type: str
+    subject_id: str
+    payload_ref: str
+    producer: str
+    produced_at: str
+    schema_version: str = "1.0.0"
+    caused_by: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not self.evidence_event_id:
+            raise ValueError("EvidenceEvent requiere evidence_event_id")
+        if self.event_type not in VALID_EVIDENCE_EVENT_TYPES:
+            raise ValueError(
+                f"event_type fuera del enum cerrado: {self.event_type!r}"
+            )
+        if not self.subject_id:
+            raise ValueError("EvidenceEvent requiere subject_id")
+        if not self.payload_ref:
+            raise ValueError(
+                "EvidenceEvent requiere payload_ref; la evidencia apunta, no copia"
+            )
+        if not self.producer:
+            raise ValueError("EvidenceEvent requiere producer")
+        if not _is_iso8601_utc(self.produced_at):
+            raise ValueError(
+                f"produced_at debe ser ISO-8601 UTC con 'Z': {self.produced_at!r}"
+            )
+        if not isinstance(self.caused_by, tuple):
+            object.__setattr__(self, "caused_by", tuple(self.caused_by))
+
+
+class EvidenceLog:
+    """Log append-only de evidencia con orden total por ``produced_at``.
+
+    El orden se impone en la escritura: cada evento debe producirse en o
+    después del último registrado (RFC-08 §4.2).
+    """
+
+    def __init__(self) -> None:
+        self._events: List[EvidenceEvent] = []
+        self._event_ids: Set[str] = set()
+        #: Lista paralela de ``produced_at``; el append la mantiene ordenada,
+        #: lo que habilita búsqueda binaria en las consultas temporales.
+        self._produced_at_keys: List[str] = []
+
+    def append(self, event: EvidenceEvent) -> None:
+        # Los identificadores se internan: cada id aparece una vez al
+        # escribirse y muchas veces en caused_by de eventos posteriores,
+        # así que la membresía en el set se resuelve por identidad de
+        # puntero y las copias repetidas comparten un solo str.
+        event_id = sys.intern(event.evidence_event_id)
+        if event_id in self._event_ids:
+            raise ValueError(
+                f"Evento ya registrado; el log es append-only: {event_id}"
+            )
+        for cause_id in event.caused_by:
+            if sys.intern(cause_id) not in self._event_ids:
+                raise ValueError(
+                    f"caused_by apunta a evidencia inexistente: {cause_id!r}"
+                )
+        if self._events and event.produced_at < self._events[-1].produced_at:
+            raise ValueError(
+                "produced_at rompe el orden total del log: "
+                f"{event.produced_at!r} < {self._events[-1].produced_at!r}"
+            )
+        self._events.append(event)
+        self._event_ids.add(event_id)
+        self._produced_at_keys.append(event.produced_at)
+
+    def at_or_before(self, produced_at: str) -> List[EvidenceEvent]:
+        """Prefijo del log con ``produced_at`` menor o igual al instante dado.
+
+        El log está ordenado por construcción, así que el corte se localiza
+        por bisección en lugar de recorrer todos los eventos.
+        """
+        idx = bisect_right(self._produced_at_keys, produced_at)
+        return self._events[:idx]
+
+    def iter_all(self) -> Iterator[EvidenceEvent]:
+        return iter(self._events)
+
+    def __contains__(self, evidence_event_id: str) -> bool:
+        return evidence_event_id in self._event_ids
+
+    def __len__(self) -> int:
+        return len(self._events)
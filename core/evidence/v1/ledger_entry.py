@@ -0,0 +1,76 @@
+"""Entradas del ledger inmutable WORM (RFC-09 §4).
+
+El ledger encadena hashes de contenido: cada entrada referencia el hash
+de la anterior, de modo que cualquier alteración histórica es detectable.
+"""
+
+from dataclasses import dataclass
+
+from .evidence_event import _is_iso8601_utc
+
+#: Tipos de entrada admitidos (RFC-09 §4.1, enum cerrado).
+VALID_ENTRY_TYPES = frozenset(
+    {"RAW_PAYLOAD", "EVIDENCE_EVENT", "DERIVED_ARTIFACT", "OTHER"}
+)
+
+#: Bases legales de retención admitidas (RFC-09 §4.2, enum cerrado).
+VALID_LEGAL_BASIS = frozenset({"AUDIT", "CONTRACT", "REGULATORY", "INTERNAL"})
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerEntry:
+    """Entrada inmutable del ledger, encadenada por hash (RFC-09 §4.1)."""
+
+    ledger_entry_id: str
+    entry_type: str
+    content_hash: str
+    content_pointer: str
+    previous_entry_hash: str
+    writer_identity: str
+    written_at: str
+    retention_policy_id: str
+    schema_version: str = "1.0.0"
+
+    def __post_init__(self) -> None:
+        if not self.ledger_entry_id:
+            raise ValueError("LedgerEntry requiere ledger_entry_id")
+        if self.entry_type not in VALID_ENTRY_TYPES:
+            raise ValueError(
+                f"entry_type fuera del enum cerrado: {self.entry_type!r}"
+            )
+        if not self.content_hash:
+            raise ValueError("LedgerEntry requiere content_hash")
+        if not self.content_pointer:
+            raise ValueError("LedgerEntry requiere content_pointer")
+        if not self.writer_identity:
+            raise ValueError("LedgerEntry requiere writer_identity")
+        if not _is_iso8601_utc(self.written_at):
+            raise ValueError(
+                f"written_at debe ser ISO-8601 UTC con 'Z': {self.written_at!r}"
+            )
+        if not self.retention_policy_id:
+            raise ValueError("LedgerEntry requiere retention_policy_id")
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    """Política de retención asociada a entradas del ledger (RFC-09 §4.2)."""
+
+    retention_policy_id: str
+    retention_period: str
+    legal_basis: str
+    immutable_until: str
+
+    def __post_init__(self) -> None:
+        if not self.retention_policy_id:
+            raise ValueError("RetentionPolicy requiere retention_policy_id")
+        if not self.retention_period:
+            raise ValueError("RetentionPolicy requiere retention_period")
+        if self.legal_basis not in VALID_LEGAL_BASIS:
+            raise ValueError(
+                f"legal_basis fuera del enum cerrado: {self.legal_basis!r}"
+            )
+        if not _is_iso8601_utc(self.immutable_until):
+            raise ValueError(
+                f"immutable_until debe ser ISO-8601 UTC con 'Z': {self.immutable_until!r}"
+            )
@@ -0,0 +1,23 @@
+"""Guardián de idempotencia y replay determinista (RFC-10)."""
+
+from .v1 import (
+    Decision,
+    Guardian,
+    IdempotencyKey,
+    IdempotencyRecord,
+    KeyBuilder,
+    ReplayEngine,
+    Scope,
+    replay_fingerprint,
+)
+
+__all__ = [
+    "Decision",
+    "Guardian",
+    "IdempotencyKey",
+    "IdempotencyRecord",
+    "KeyBuilder",
+    "ReplayEngine",
+    "Scope",
+    "replay_fingerprint",
+]
@@ -0,0 +1,17 @@
+"""Versión 1 del guardián de idempotencia: claves, decisiones y replay."""
+
+from .guardian import Guardian
+from .key_builder import KeyBuilder
+from .models import Decision, IdempotencyKey, IdempotencyRecord, Scope
+from .replay import ReplayEngine, replay_fingerprint
+
+__all__ = [
+    "Decision",
+    "Guardian",
+    "IdempotencyKey",
+    "IdempotencyRecord",
+    "KeyBuilder",
+    "ReplayEngine",
+    "Scope",
+    "replay_fingerprint",
+]
@@ -0,0 +1,113 @@
+"""Guardián de idempotencia (RFC-10 §5).
+
+Arbitra cada intento de escritura lógica: la primera aparición de una
+clave se acepta, una repetición exacta se rechaza como duplicado y una
+colisión (mismo sujeto, payload distinto) se marca ambigua para revisión.
+Solo ``ACCEPT_FIRST`` habilita la escritura.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List
+
+from .models import Decision, IdempotencyKey, IdempotencyRecord, Scope
+
+#: Formato de huella pre-ligado: un solo llamable reutilizado por
+#: decisión, sin recompilar la plantilla f-string en cada llamada.
+_FP_FMT = "{}|{}|{}|{}|{}".format
+
+#: Valores de enum resueltos una vez: ``.value`` sobre un miembro de enum
+#: pasa por un descriptor; el dict plano lo convierte en un lookup simple.
+_SCOPE_VALUE = {scope: scope.value for scope in Scope}
+_DECISION_VALUE = {decision: decision.value for decision in Decision}
+
+
+class Guardian:
+    """Árbitro en memoria de decisiones de idempotencia, append-only."""
+
+    def __init__(self) -> None:
+        #: Primera decisión por operación lógica (scope|principal|subject).
+        self._first_seen: Dict[str, IdempotencyRecord] = {}
+        #: Historial completo de decisiones, en orden de llegada.
+        self._records: List[IdempotencyRecord] = []
+
+    def check(self, idempotency_key: IdempotencyKey) -> IdempotencyRecord:
+        """Decide sobre una clave y registra la decisión con su evidencia."""
+        registry_key = (
+            f"{_SCOPE_VALUE[idempotency_key.scope]}|{idempotency_key.principal}|"
+            f"{idempotency_key.subject}"
+        )
+        now = (
+            datetime.now(timezone.utc)
+            .isoformat(timespec="microseconds")
+            .replace("+00:00", "Z")
+        )
+        #: La huella es función pura de la clave: se calcula una sola vez
+        #: por decisión, tanto para comparar como para registrar.
+        current_fingerprint = self._build_fingerprint(idempotency_key)
+        existing = self._first_seen.get(registry_key)
+        if existing is None:
+            record = self._make_record(
+                idempotency_key,
+                Decision.ACCEPT_FIRST,
+                current_fingerprint,
+                first_seen_at=now,
+                decided_at=now,
+            )
+            self._first_seen[registry_key] = record
+            self._records.append(record)
+            return record
+        if existing.fingerprint == current_fingerprint:
+            decision = Decision.REJECT_DUPLICATE
+        else:
+            decision = Decision.FLAG_AMBIGUOUS
+        record = self._make_record(
+            idempotency_key,
+            decision,
+            current_fingerprint,
+            first_seen_at=existing.first_seen_at,
+            decided_at=now,
+        )
+        self._records.append(record)
+        return record
+
+    def allows_write(self, record: IdempotencyRecord) -> bool:
+        """Solo ``ACCEPT_FIRST`` habilita la escritura lógica (RFC-10 §5.2)."""
+        return record.decision is Decision.ACCEPT_FIRST
+
+    def iter_records(self) -> Iterator[IdempotencyRecord]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _make_record(
+        self,
+        idempotency_key: IdempotencyKey,
+        decision: Decision,
+        fingerprint: str,
+        first_seen_at: str,
+        decided_at: str,
+    ) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            idempotency_record_id=uuid.uuid4().hex,
+            idempotency_key=idempotency_key,
+            scope=idempotency_key.scope,
+            decision=decision,
+            first_seen_at=first_seen_at,
+            decided_at=decided_at,
+            rule_version=idempotency_key.version,
+            fingerprint=fingerprint,
+            notes=f"decision={_DECISION_VALUE[decision]}",
+        )
+
+    @staticmethod
+    def _build_fingerprint(idempotency_key: IdempotencyKey) -> str:
+        return _FP_FMT(
+            _SCOPE_VALUE[idempotency_key.scope],
+            idempotency_key.principal,
+            idempotency_key.subject,
+            idempotency_key.payload_hash,
+            idempotency_key.version,
+        )
+
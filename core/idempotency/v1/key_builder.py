@@ -0,0 +1,84 @@
+"""Construcción determinista de claves de idempotencia (RFC-10 §4.1).
+
+El hash del payload se calcula sobre una serialización canónica (claves
+ordenadas, sin espacios) para que el mismo contenido produzca siempre la
+misma clave, independientemente del orden de campos del emisor.
+"""
+
+import binascii
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict
+
+from .models import IdempotencyKey, Scope
+
+try:
+    # Serializador canónico preferido: emite bytes compactos y ordenados
+    # sin pasar por un str intermedio. El fallback stdlib produce los
+    # mismos bytes para payloads JSON convencionales.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=4096)
+def _sha256_hex(data: bytes) -> str:
+    """SHA-256 hexadecimal con memoización: los reintentos y duplicados
+    (el caso que motiva la idempotencia) rehashean el mismo canónico."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class KeyBuilder:
+    """Fábrica de ``IdempotencyKey`` para un ámbito y versión fijos."""
+
+    def __init__(self, scope: Scope, version: str = "1.0.0") -> None:
+        if not isinstance(scope, Scope):
+            raise ValueError(f"scope fuera del enum cerrado: {scope!r}")
+        self.scope = scope
+        self.version = version
+        #: ``scope.value`` resuelto una sola vez; el ámbito es fijo por builder.
+        self._scope_value = scope.value
+        self._scope_value_bytes = scope.value.encode("ascii")
+
+    def build(self, principal: str, subject: str, payload: Dict[str, Any]) -> IdempotencyKey:
+        payload_hash = self._hash_payload(payload)
+        return IdempotencyKey(
+            scope=self.scope,
+            principal=principal,
+            subject=subject,
+            payload_hash=payload_hash,
+            version=self.version,
+        )
+
+    def key_digest(self, key: IdempotencyKey) -> str:
+        """Identidad compacta de la clave, apta para índices y registros.
+
+        Hashea los componentes como bytes en una sola pasada, sin construir
+        ni recodificar la cadena intermedia ``a|b|c|...``.
+        """
+        digest = hashlib.sha256(
+            b"|".join(
+                (
+                    self._scope_value_bytes,
+                    key.principal.encode("utf-8"),
+                    key.subject.encode("utf-8"),
+                    key.payload_hash.encode("ascii"),
+                    key.version.encode("ascii"),
+                )
+            )
+        ).digest()
+        return binascii.hexlify(digest).decode("ascii")
+
+    def _hash_payload(self, payload: Dict[str, Any]) -> str:
+        if orjson is not None:
+            canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        else:
+            canonical = json.dumps(
+                payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+            ).encode("utf-8")
+        return _sha256_hex(canonical)
+
+    @staticmethod
+    def _hash_string(value: str) -> str:
+        return _sha256_hex(value.encode("utf-8"))
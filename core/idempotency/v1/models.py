@@ -0,0 +1,87 @@
+"""Contratos del guardián de idempotencia (RFC-10 §3 y §4).
+
+La idempotencia se decide por ámbito: una misma operación lógica solo se
+materializa una vez, y toda decisión queda registrada con evidencia.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Tuple
+
+
+class Scope(Enum):
+    """Ámbitos en los que el guardián arbitra escrituras (RFC-10 §3.1)."""
+
+    INGEST = "INGEST"
+    CANONICALIZE = "CANONICALIZE"
+    EVIDENCE_WRITE = "EVIDENCE_WRITE"
+    CORRELATE = "CORRELATE"
+    STATE_EVAL = "STATE_EVAL"
+    DISCREPANCY_EVAL = "DISCREPANCY_EVAL"
+
+
+class Decision(Enum):
+    """Decisiones posibles del guardián (RFC-10 §3.2)."""
+
+    ACCEPT_FIRST = "ACCEPT_FIRST"
+    REJECT_DUPLICATE = "REJECT_DUPLICATE"
+    FLAG_AMBIGUOUS = "FLAG_AMBIGUOUS"
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyKey:
+    """Clave lógica de una operación: quién, qué y sobre qué (RFC-10 §4.1)."""
+
+    scope: Scope
+    principal: str
+    subject: str
+    payload_hash: str
+    version: str = "1.0.0"
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.scope, Scope):
+            raise ValueError(f"scope fuera del enum cerrado: {self.scope!r}")
+        if not self.principal:
+            raise ValueError("IdempotencyKey requiere principal")
+        if not self.subject:
+            raise ValueError("IdempotencyKey requiere subject")
+        if not self.payload_hash:
+            raise ValueError("IdempotencyKey requiere payload_hash")
+        if not self.version:
+            raise ValueError("IdempotencyKey requiere version")
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """Decisión inmutable del guardián sobre una clave (RFC-10 §4.2)."""
+
+    idempotency_record_id: str
+    idempotency_key: IdempotencyKey
+    scope: Scope
+    decision: Decision
+    first_seen_at: str
+    decided_at: str
+    rule_version: str = "1.0.0"
+    evidence_refs: Tuple[str, ...] = ()
+    #: Huella canónica de la clave arbitrada; campo de primera clase para
+    #: comparar decisiones sin parsear ``notes``.
+    fingerprint: str = ""
+    notes: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.idempotency_record_id:
+            raise ValueError("IdempotencyRecord requiere idempotency_record_id")
+        if not isinstance(self.idempotency_key, IdempotencyKey):
+            raise ValueError(
+                f"idempotency_key debe ser IdempotencyKey: {self.idempotency_key!r}"
+            )
+        if not isinstance(self.scope, Scope):
+            raise ValueError(f"scope fuera del enum cerrado: {self.scope!r}")
+        if not isinstance(self.decision, Decision):
+            raise ValueError(f"decision fuera del enum cerrado: {self.decision!r}")
+        if not self.first_seen_at:
+            raise ValueError("IdempotencyRecord requiere first_seen_at")
+        if not self.decided_at:
+            raise ValueError("IdempotencyRecord requiere decided_at")
+        if not isinstance(self.evidence_refs, tuple):
+            object.__setattr__(self, "evidence_refs", tuple(self.evidence_refs))
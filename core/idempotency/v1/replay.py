@@ -0,0 +1,65 @@
+"""Replay determinista (RFC-10 §6).
+
+Reproducir el mismo log de evidencia con la misma versión de motor debe
+producir el mismo resultado; la huella de replay permite comparar dos
+reproducciones sin comparar los artefactos completos.
+"""
+
+import binascii
+import hashlib
+from typing import Any, Dict, Iterable, List
+
+from .models import Decision, IdempotencyKey, IdempotencyRecord, Scope
+
+
+def replay_fingerprint(engine_version: str, events: Iterable[Any]) -> str:
+    """Huella determinista de una reproducción: versión del motor + eventos.
+
+    Los eventos se toman en el orden recibido (el orden total del log es
+    responsabilidad del llamador, RFC-08 §4.2). El hash se alimenta en
+    streaming, evento a evento: la huella de un log grande no materializa
+    el buffer concatenado de todos los identificadores.
+    """
+    hasher = hashlib.sha256(engine_version.encode("utf-8"))
+    hasher.update(b"|")
+    first = True
+    for event in events:
+        if first:
+            first = False
+        else:
+            hasher.update(b";")
+        hasher.update(event.event_id.encode("utf-8"))
+    return binascii.hexlify(hasher.digest()).decode("ascii")
+
+
+class ReplayEngine:
+    """Reconstrucción de decisiones de idempotencia desde artefactos serializados."""
+
+    def __init__(self, engine_version: str = "1.0.0") -> None:
+        self.engine_version = engine_version
+
+    def reconstruct(self, records_data: Iterable[Dict[str, Any]]) -> List[IdempotencyRecord]:
+        """Reconstruye registros en orden; cualquier dato inválido se rechaza."""
+        return [self._reconstruct_record(data) for data in records_data]
+
+    def _reconstruct_record(self, data: Dict[str, Any]) -> IdempotencyRecord:
+        key_data = data["idempotency_key"]
+        idempotency_key = IdempotencyKey(
+            scope=Scope(key_data["scope"]),
+            principal=key_data["principal"],
+            subject=key_data["subject"],
+            payload_hash=key_data["payload_hash"],
+            version=key_data.get("version", "1.0.0"),
+        )
+        return IdempotencyRecord(
+            idempotency_record_id=data["idempotency_record_id"],
+            idempotency_key=idempotency_key,
+            scope=Scope(data["scope"]),
+            decision=Decision(data["decision"]),
+            first_seen_at=data["first_seen_at"],
+            decided_at=data["decided_at"],
+            rule_version=data.get("rule_version", "1.0.0"),
+            evidence_refs=tuple(data.get("evidence_refs", ())),
+            fingerprint=data.get("fingerprint", ""),
+            notes=data.get("notes", ""),
+        )